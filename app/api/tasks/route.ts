@@ -41,6 +41,17 @@ export async function GET() {
       console.error('[GET /api/tasks] Supabase error:', JSON.stringify(error));
       return NextResponse.json({ error: 'Failed to fetch tasks', details: error.message }, { status: 500 });
     }
+    // No hot row: the user may have been moved to todoapp_tasks_archive by the archive job
+    if (!data) {
+      const { data: restored, error: rehydrateError } = await getSupabase()
+        .rpc('todoapp_rehydrate_user', { p_user_id: userId });
+      if (rehydrateError) {
+        console.error('[GET /api/tasks] Rehydrate error:', JSON.stringify(rehydrateError));
+      } else if (restored && restored.length > 0) {
+        console.log('[GET /api/tasks] Rehydrated archived user');
+        return NextResponse.json(restored[0]);
+      }
+    }
     console.log('[GET /api/tasks] Success, data:', !!data);
     return NextResponse.json(data || {});
   } catch (error) {
@@ -49,6 +60,15 @@ export async function GET() {
   }
 }
 
+function isValidTimeZone(timezone: string) {
+  try {
+    new Intl.DateTimeFormat('en-US', { timeZone: timezone });
+    return true;
+  } catch {
+    return false;
+  }
+}
+
 export async function POST(request: Request) {
   try {
     const { userId } = await auth();
@@ -56,17 +76,27 @@ export async function POST(request: Request) {
     if (!userId) {
       return NextResponse.json({ error: 'Unauthorized' }, { status: 401 });
     }
-    const { content } = await request.json();
+    const { content, timezone } = await request.json();
     const timestamp = new Date().toISOString();
-    const { error } = await getSupabase()
+    const row: { user_id: string; content: string; updated_at: string; timezone?: string } = {
+      user_id: userId,
+      content,
+      updated_at: timestamp,
+    };
+    // Stored for the server-side color reset (scripts/reset_colors.py); ignore invalid zones
+    if (typeof timezone === 'string' && isValidTimeZone(timezone)) {
+      row.timezone = timezone;
+    }
+    let { error } = await getSupabase()
       .from('todoapp_tasks')
-      .upsert([
-        {
-          user_id: userId,
-          content,
-          updated_at: timestamp,
-        },
-      ], { onConflict: 'user_id' });
+      .upsert([row], { onConflict: 'user_id' });
+    if (error?.code === 'PGRST204' && row.timezone) {
+      // timezone column not migrated yet: save without it rather than failing
+      delete row.timezone;
+      ({ error } = await getSupabase()
+        .from('todoapp_tasks')
+        .upsert([row], { onConflict: 'user_id' }));
+    }
     if (error) {
       console.error('[POST /api/tasks] Supabase error:', JSON.stringify(error));
       return NextResponse.json({ error: 'Failed to save tasks', details: error.message }, { status: 500 });
@@ -228,7 +228,10 @@ export default function Home() {
         const response = await fetch('/api/tasks', {
           method: 'POST',
           headers: { 'Content-Type': 'application/json' },
-          body: JSON.stringify({ content: markdown }),
+          body: JSON.stringify({
+            content: markdown,
+            timezone: Intl.DateTimeFormat().resolvedOptions().timeZone,
+          }),
         });
         if (!response.ok) {
           const errorText = await response.text();
@@ -470,6 +473,7 @@ export default function Home() {
 
   // Reset task colors at midnight (user's local time)
   // Runs on load AND sets a timer to trigger at midnight if app stays open
+  // Users idle since their midnight are reset server-side (scripts/reset_colors.py)
   const colorResetChecked = useRef(false);
   const activeTasksRef = useRef(activeTasks);
   const doneTasksRef = useRef(doneTasks);
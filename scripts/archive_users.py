@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+
+"""
+Hot/cold archival of stale users
+Moves users untouched for N days from todoapp_tasks into a compressed
+todoapp_tasks_archive table; todoapp_rehydrate_user() moves them back
+(called by GET /api/tasks when a user has no hot row)
+"""
+
+import argparse
+import time
+
+from psycopg2 import errors
+
+ARCHIVE_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS todoapp_tasks_archive (
+      user_id TEXT PRIMARY KEY,
+      source_id BIGINT NOT NULL,
+      content TEXT {compression} NOT NULL,
+      updated_at TIMESTAMPTZ NOT NULL,
+      created_at TIMESTAMPTZ NOT NULL,
+      archived_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+    ) WITH (toast_tuple_target = 128);
+"""
+
+REHYDRATE_FUNCTION_SQL = """
+    CREATE OR REPLACE FUNCTION todoapp_rehydrate_user(p_user_id TEXT)
+    RETURNS TABLE (content TEXT, updated_at TIMESTAMPTZ)
+    LANGUAGE sql
+    AS $$
+      -- Insert first: if a concurrent save already created the hot row, the
+      -- insert is skipped and the archive row is kept instead of being lost
+      WITH restored AS (
+        INSERT INTO todoapp_tasks (id, user_id, content, updated_at, created_at)
+        SELECT source_id, user_id, content, updated_at, created_at
+        FROM todoapp_tasks_archive
+        WHERE user_id = p_user_id
+        ON CONFLICT (user_id) DO NOTHING
+        RETURNING todoapp_tasks.user_id, todoapp_tasks.content, todoapp_tasks.updated_at
+      ), cleared AS (
+        DELETE FROM todoapp_tasks_archive a
+        USING restored r
+        WHERE a.user_id = r.user_id
+      )
+      SELECT restored.content, restored.updated_at FROM restored;
+    $$;
+"""
+
+ARCHIVE_BATCH_SQL = """
+    WITH victims AS (
+      SELECT id FROM todoapp_tasks
+      WHERE updated_at < NOW() - make_interval(days => %(days)s)
+      ORDER BY updated_at
+      LIMIT %(limit)s
+      FOR UPDATE SKIP LOCKED
+    ), moved AS (
+      DELETE FROM todoapp_tasks t
+      USING victims v
+      WHERE t.id = v.id
+      RETURNING t.*
+    )
+    INSERT INTO todoapp_tasks_archive (user_id, source_id, content, updated_at, created_at)
+    SELECT user_id, id, content, updated_at, created_at FROM moved
+    ON CONFLICT (user_id) DO UPDATE
+      SET source_id = EXCLUDED.source_id,
+          content = EXCLUDED.content,
+          updated_at = EXCLUDED.updated_at,
+          created_at = EXCLUDED.created_at,
+          archived_at = NOW();
+"""
+
+
+def _install_rehydrate_function(cur):
+    cur.execute(REHYDRATE_FUNCTION_SQL)
+    cur.execute("REVOKE ALL ON FUNCTION todoapp_rehydrate_user(TEXT) FROM PUBLIC;")
+    cur.execute("""
+        DO $$
+        BEGIN
+          IF EXISTS (SELECT 1 FROM pg_roles WHERE rolname = 'service_role') THEN
+            GRANT EXECUTE ON FUNCTION todoapp_rehydrate_user(TEXT) TO service_role;
+          END IF;
+        END $$;
+    """)
+
+
+def archive_exists(cur):
+    cur.execute("SELECT to_regclass('todoapp_tasks_archive') IS NOT NULL;")
+    return cur.fetchone()[0]
+
+
+def ensure_archive_schema(cur):
+    """
+    Create the archive table and rehydrate function on first use
+    Once the table exists no table DDL is issued (ALTER TABLE would take an
+    ACCESS EXCLUSIVE lock on the table GET /api/tasks rehydrates from); only
+    an outdated rehydrate function is replaced, which locks no tables
+    """
+    if not archive_exists(cur):
+        cur.execute("SAVEPOINT archive_table;")
+        try:
+            cur.execute(ARCHIVE_TABLE_SQL.format(compression='COMPRESSION lz4'))
+        except errors.FeatureNotSupported:
+            # Server built without lz4: fall back to the default pglz TOAST compression
+            cur.execute("ROLLBACK TO SAVEPOINT archive_table;")
+            cur.execute(ARCHIVE_TABLE_SQL.format(compression=''))
+        cur.execute("RELEASE SAVEPOINT archive_table;")
+
+        # Only the service role (used by the API route) may read or rehydrate archives
+        cur.execute("ALTER TABLE todoapp_tasks_archive ENABLE ROW LEVEL SECURITY;")
+        _install_rehydrate_function(cur)
+        return
+
+    cur.execute("SELECT prosrc FROM pg_proc WHERE proname = 'todoapp_rehydrate_user';")
+    row = cur.fetchone()
+    if row is None or row[0] != REHYDRATE_FUNCTION_SQL.split('$$')[1]:
+        _install_rehydrate_function(cur)
+
+
+def has_updated_at_index(cur):
+    """
+    The batch query walks todoapp_tasks_updated_at_idx (supabase-schema.sql)
+    oldest-first; it is not built here because CREATE INDEX blocks app writes
+    """
+    cur.execute("""
+        SELECT EXISTS (
+          SELECT 1 FROM pg_index
+          WHERE indexrelid = to_regclass('todoapp_tasks_updated_at_idx') AND indisvalid
+        );
+    """)
+    return cur.fetchone()[0]
+
+
+def table_stats(cur):
+    """
+    (rows, heap bytes, toast bytes, index bytes) for the hot and cold tables
+    """
+    stats = {}
+    for table in ('todoapp_tasks', 'todoapp_tasks_archive'):
+        if table == 'todoapp_tasks_archive' and not archive_exists(cur):
+            continue
+        cur.execute(f"""
+            SELECT
+              (SELECT COUNT(*) FROM {table}),
+              pg_relation_size(c.oid),
+              COALESCE(pg_total_relation_size(NULLIF(c.reltoastrelid, 0)), 0),
+              pg_indexes_size(c.oid)
+            FROM pg_class c
+            WHERE c.oid = %s::regclass;
+        """, (table,))
+        stats[table] = cur.fetchone()
+    return stats
+
+
+def print_stats(stats):
+    for table, (rows, heap, toast, indexes) in stats.items():
+        print(f"   {table}: {rows:,} rows, heap {heap / 1e6:,.1f} MB, "
+              f"TOAST {toast / 1e6:,.1f} MB, indexes {indexes / 1e6:,.1f} MB")
+
+
+def rehydrate(cur, user_id):
+    cur.execute("SELECT * FROM todoapp_rehydrate_user(%s);", (user_id,))
+    return cur.fetchone()
+
+
+def run_archive(argv):
+    """
+    archive subcommand
+    """
+    parser = argparse.ArgumentParser(prog='db_operations.py archive')
+    parser.add_argument('--days', type=int, default=90, help='Archive users untouched for this many days')
+    parser.add_argument('--batch-size', type=int, default=200, help='Users moved per transaction')
+    parser.add_argument('--max-users', type=int, help='Stop after moving this many users')
+    parser.add_argument('--pause', type=float, default=0.1, help='Seconds to sleep between batches')
+    parser.add_argument('--dry-run', action='store_true', help='Only count users that would be archived')
+    parser.add_argument('--rehydrate', metavar='USER_ID', help='Move one archived user back to the hot table')
+    args = parser.parse_args(argv)
+
+    from db_operations import get_database_connection
+
+    try:
+        print("🧊 HOT/COLD ARCHIVAL")
+        print("=" * 60)
+        print()
+
+        conn = get_database_connection()
+        cur = conn.cursor()
+
+        if args.rehydrate:
+            print(f"1️⃣ Rehydrating {args.rehydrate}...")
+            row = rehydrate(cur, args.rehydrate) if archive_exists(cur) else None
+            conn.commit()
+            if row is None:
+                print("   ⚠️  User not in archive (or already has a hot row)")
+            else:
+                print(f"   ✅ Restored (last updated {row[1]})")
+            cur.close()
+            conn.close()
+            return True
+
+        if not args.dry_run:
+            print("1️⃣ Ensuring archive table and rehydrate function...")
+            ensure_archive_schema(cur)
+            conn.commit()
+            print("   ✅ Ready")
+            if not has_updated_at_index(cur):
+                print("   ⚠️  todoapp_tasks_updated_at_idx missing or invalid - batches will scan the table;")
+                print("      create it with CREATE INDEX CONCURRENTLY (see supabase-schema.sql)")
+            conn.commit()
+            print()
+
+        print("2️⃣ Table sizes before...")
+        print_stats(table_stats(cur))
+        conn.commit()
+        print()
+
+        if args.dry_run:
+            cur.execute("""
+                SELECT COUNT(*) FROM todoapp_tasks
+                WHERE updated_at < NOW() - make_interval(days => %s);
+            """, (args.days,))
+            print(f"3️⃣ {cur.fetchone()[0]:,} users untouched for {args.days}+ days would be archived")
+            cur.close()
+            conn.close()
+            return True
+
+        print(f"3️⃣ Archiving users untouched for {args.days}+ days...")
+        start_time = time.time()
+        moved = batches = 0
+        while args.max_users is None or moved < args.max_users:
+            limit = args.batch_size
+            if args.max_users is not None:
+                limit = min(limit, args.max_users - moved)
+            cur.execute(ARCHIVE_BATCH_SQL, {'days': args.days, 'limit': limit})
+            conn.commit()
+            if cur.rowcount == 0:
+                break
+            moved += cur.rowcount
+            batches += 1
+            if batches % 25 == 0:
+                print(f"   … {moved:,} users archived")
+            time.sleep(args.pause)
+
+        duration = time.time() - start_time
+        print(f"   ✅ {moved:,} users archived in {batches:,} batches ({duration:.2f}s)")
+        print()
+
+        print("4️⃣ Table sizes after...")
+        print_stats(table_stats(cur))
+        print("   💡 Space is reused after autovacuum; run VACUUM todoapp_tasks to reclaim it sooner")
+        print()
+
+        cur.close()
+        conn.close()
+
+        print("🎯 ARCHIVAL COMPLETE!")
+        return True
+
+    except Exception as e:
+        print(f"❌ ERROR: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
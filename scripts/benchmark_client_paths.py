@@ -0,0 +1,379 @@
+#!/usr/bin/env python3
+
+"""
+Client-path comparison: supabase-py vs pooled HTTP (requests.Session) vs psycopg2
+All three run the same point-read, upsert and aggregate workloads against a
+LOCAL Postgres; the HTTP paths go through a PostgREST-like stand-in server.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from multiprocessing import Event, Process
+from threading import local
+from urllib.parse import parse_qsl, urlsplit
+
+import psycopg2
+from dotenv import load_dotenv
+
+SCHEMA = 'client_bench'
+DEFAULT_DSN = 'postgresql://postgres@localhost:5432/postgres'
+COLUMNS = ('id', 'user_id', 'content', 'updated_at', 'created_at')
+# Signature-shaped placeholder: supabase-py rejects keys that don't look like a JWT
+BENCH_KEY = 'bench.bench.bench'
+
+SAMPLE_CONTENT = ('| P | Category | Subcategory | Task | Status | Color | Created | Updated |\n'
+                  '|---|----------|-------------|------|--------|-------|---------|----------|\n'
+                  + '| 1 | Work | Email | Reply to the team thread | to_do | white | 2025-01-01 | 2025-01-01 |\n' * 20)
+
+
+def connect(dsn):
+    return psycopg2.connect(dsn, options=f'-c search_path={SCHEMA}')
+
+
+def seed(dsn, users):
+    print("1️⃣ Seeding benchmark schema...")
+    conn = psycopg2.connect(dsn)
+    conn.autocommit = True
+    cur = conn.cursor()
+    cur.execute(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE;")
+    cur.execute(f"CREATE SCHEMA {SCHEMA};")
+    cur.execute(f"""
+        CREATE TABLE {SCHEMA}.todoapp_tasks (
+          id BIGSERIAL PRIMARY KEY,
+          user_id TEXT NOT NULL,
+          content TEXT NOT NULL,
+          updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+          created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+        );
+    """)
+    cur.execute(f"""
+        INSERT INTO {SCHEMA}.todoapp_tasks (user_id, content)
+        SELECT 'user_' || i, %s FROM generate_series(1, %s) AS i;
+    """, (SAMPLE_CONTENT, users))
+    cur.execute(f"CREATE UNIQUE INDEX todoapp_tasks_user_id_key ON {SCHEMA}.todoapp_tasks(user_id);")
+    cur.execute(f"ANALYZE {SCHEMA}.todoapp_tasks;")
+    cur.close()
+    conn.close()
+    print(f"   ✅ {users:,} users")
+    print()
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """
+    The subset of PostgREST the scripts use on /rest/v1/todoapp_tasks:
+    select=, <col>=eq.<value>, order=<col>.<dir>, limit=, Prefer: count=exact,
+    HEAD, and POST upserts with on_conflict=user_id
+    """
+
+    protocol_version = 'HTTP/1.1'
+    # Headers and body go out as separate writes; without TCP_NODELAY every
+    # response stalls ~40ms on Nagle + delayed ACK, which PostgREST doesn't
+    disable_nagle_algorithm = True
+    dsn = None
+    connections = local()
+
+    def log_message(self, format, *args):
+        pass
+
+    def conn(self):
+        if not hasattr(self.connections, 'conn'):
+            self.connections.conn = connect(self.dsn)
+            self.connections.conn.autocommit = True
+        return self.connections.conn
+
+    def send_json(self, status, body, headers=None):
+        payload = json.dumps(body, default=str).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        if self.command != 'HEAD':
+            self.wfile.write(payload)
+
+    def parse(self):
+        url = urlsplit(self.path)
+        if url.path.rstrip('/') != '/rest/v1/todoapp_tasks':
+            self.send_json(404, {'message': 'not found'})
+            return None
+        return parse_qsl(url.query)
+
+    def do_GET(self):
+        params = self.parse()
+        if params is None:
+            return
+
+        columns, where, values, order, limit = ['*'], [], [], '', ''
+        for key, value in params:
+            if key == 'select':
+                columns = [c.strip() for c in value.split(',') if c.strip() in COLUMNS] or ['*']
+            elif key == 'order':
+                column, _, direction = value.partition('.')
+                if column in COLUMNS:
+                    order = f" ORDER BY {column} {'DESC' if direction.startswith('desc') else 'ASC'}"
+            elif key == 'limit':
+                limit = f" LIMIT {int(value)}"
+            elif key in COLUMNS and value.startswith('eq.'):
+                where.append(f"{key} = %s")
+                values.append(value[3:])
+        where_sql = f" WHERE {' AND '.join(where)}" if where else ''
+
+        cur = self.conn().cursor()
+        headers = {}
+        if 'count=exact' in self.headers.get('Prefer', ''):
+            cur.execute(f"SELECT COUNT(*) FROM todoapp_tasks{where_sql};", values)
+            total = cur.fetchone()[0]
+            headers['Content-Range'] = f"*/{total}"
+
+        rows = []
+        if self.command != 'HEAD':
+            cur.execute(f"SELECT {', '.join(columns)} FROM todoapp_tasks{where_sql}{order}{limit};", values)
+            names = [d[0] for d in cur.description]
+            rows = [dict(zip(names, row)) for row in cur.fetchall()]
+        cur.close()
+        self.send_json(200, rows, headers)
+
+    do_HEAD = do_GET
+
+    def do_POST(self):
+        if self.parse() is None:
+            return
+        body = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))))
+        rows = body if isinstance(body, list) else [body]
+
+        cur = self.conn().cursor()
+        for row in rows:
+            cur.execute("""
+                INSERT INTO todoapp_tasks (user_id, content, updated_at)
+                VALUES (%s, %s, COALESCE(%s::timestamptz, NOW()))
+                ON CONFLICT (user_id) DO UPDATE
+                  SET content = EXCLUDED.content, updated_at = EXCLUDED.updated_at;
+            """, (row['user_id'], row['content'], row.get('updated_at')))
+        cur.close()
+        self.send_json(201, [])
+
+
+def serve(dsn, port, ready):
+    StandInHandler.dsn = dsn
+    server = ThreadingHTTPServer(('127.0.0.1', port), StandInHandler)
+    ready.set()
+    server.serve_forever()
+
+
+def psycopg2_path(dsn, url):
+    conn = connect(dsn)
+    conn.autocommit = True
+    cur = conn.cursor()
+
+    def point_read(user_id):
+        cur.execute("SELECT content, updated_at FROM todoapp_tasks WHERE user_id = %s;", (user_id,))
+        return cur.fetchone()
+
+    def upsert(user_id, content):
+        cur.execute("""
+            INSERT INTO todoapp_tasks (user_id, content, updated_at) VALUES (%s, %s, NOW())
+            ON CONFLICT (user_id) DO UPDATE
+              SET content = EXCLUDED.content, updated_at = EXCLUDED.updated_at;
+        """, (user_id, content))
+
+    def aggregate():
+        cur.execute("SELECT COUNT(*) FROM todoapp_tasks;")
+        return cur.fetchone()[0]
+
+    return {'point_read': point_read, 'upsert': upsert, 'aggregate': aggregate}, conn.close
+
+
+def http_path(dsn, url):
+    import requests
+
+    session = requests.Session()
+    session.headers.update({'apikey': BENCH_KEY, 'Authorization': f'Bearer {BENCH_KEY}'})
+    base = f"{url}/rest/v1/todoapp_tasks"
+
+    def point_read(user_id):
+        response = session.get(base, params={'select': 'content,updated_at', 'user_id': f'eq.{user_id}'})
+        return response.json()
+
+    def upsert(user_id, content):
+        session.post(base, params={'on_conflict': 'user_id'},
+                     headers={'Prefer': 'resolution=merge-duplicates'},
+                     json=[{'user_id': user_id, 'content': content}])
+
+    def aggregate():
+        response = session.head(base, headers={'Prefer': 'count=exact'})
+        return int(response.headers['Content-Range'].split('/')[-1])
+
+    return {'point_read': point_read, 'upsert': upsert, 'aggregate': aggregate}, session.close
+
+
+def supabase_path(dsn, url):
+    from supabase import create_client
+
+    client = create_client(url, BENCH_KEY)
+
+    def point_read(user_id):
+        return client.table('todoapp_tasks').select('content, updated_at').eq('user_id', user_id).execute().data
+
+    def upsert(user_id, content):
+        client.table('todoapp_tasks').upsert([{'user_id': user_id, 'content': content}],
+                                             on_conflict='user_id').execute()
+
+    def aggregate():
+        return client.table('todoapp_tasks').select('id', count='exact', head=True).execute().count
+
+    return {'point_read': point_read, 'upsert': upsert, 'aggregate': aggregate}, lambda: None
+
+
+PATHS = {
+    'psycopg2': psycopg2_path,
+    'pooled_http': http_path,
+    'supabase_py': supabase_path,
+}
+
+
+def workload_args(operation, n, users):
+    user_id = f"user_{n % users + 1}"
+    if operation == 'upsert':
+        return (user_id, SAMPLE_CONTENT)
+    if operation == 'point_read':
+        return (user_id,)
+    return ()
+
+
+def measure(func, operation, iterations, users):
+    """
+    Per-op wall latency and CPU time, then a traced pass for allocations
+    """
+    for n in range(5):
+        func(*workload_args(operation, n, users))
+
+    latencies = []
+    cpu_start = time.process_time()
+    for n in range(iterations):
+        args = workload_args(operation, n, users)
+        start = time.perf_counter()
+        func(*args)
+        latencies.append(time.perf_counter() - start)
+    cpu = (time.process_time() - cpu_start) / iterations
+
+    traced = min(iterations, 50)
+    peaks = []
+    # Under --profile tracemalloc is already running; leave it on for the profiler
+    # (peaks are per-call deltas, so earlier allocations don't skew them)
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    for n in range(traced):
+        args = workload_args(operation, n, users)
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        func(*args)
+        _, peak = tracemalloc.get_traced_memory()
+        peaks.append(peak - before)
+    if not was_tracing:
+        tracemalloc.stop()
+
+    latencies.sort()
+    return {
+        'p50_ms': statistics.median(latencies) * 1000,
+        'p95_ms': latencies[int(len(latencies) * 0.95) - 1] * 1000,
+        'cpu_ms': cpu * 1000,
+        'alloc_kb': statistics.median(peaks) / 1024,
+    }
+
+
+def run_benchmark(argv):
+    parser = argparse.ArgumentParser(prog='benchmark_client_paths.py')
+    parser.add_argument('--dsn', help='Local Postgres DSN (default: BENCH_CONNECTION_STRING)')
+    parser.add_argument('--users', type=int, default=10000, help='Rows to seed')
+    parser.add_argument('--iterations', type=int, default=300, help='Operations per workload and path')
+    parser.add_argument('--port', type=int, default=54321, help='Port for the PostgREST stand-in')
+    parser.add_argument('--paths', default=','.join(PATHS), help='Comma-separated client paths to run')
+    parser.add_argument('--json', help='Also write results to this JSON file')
+    args = parser.parse_args(argv)
+
+    load_dotenv('.env.local')
+    dsn = args.dsn or os.getenv('BENCH_CONNECTION_STRING', DEFAULT_DSN)
+    url = f"http://127.0.0.1:{args.port}"
+
+    print("🏁 CLIENT PATH BENCHMARK")
+    print("=" * 60)
+    print(f"📍 {dsn.split('@')[-1]} via stand-in {url}")
+    print()
+
+    server = None
+    try:
+        seed(dsn, args.users)
+
+        # Separate process so the server's CPU and allocations aren't charged to the clients
+        ready = Event()
+        server = Process(target=serve, args=(dsn, args.port, ready), daemon=True)
+        server.start()
+        ready.wait(10)
+
+        print("2️⃣ Running workloads...")
+        results = {}
+        for name in args.paths.split(','):
+            try:
+                operations, close = PATHS[name](dsn, url)
+            except ImportError as e:
+                print(f"   ⚠️  Skipping {name}: {e}")
+                continue
+            results[name] = {}
+            for operation, func in operations.items():
+                results[name][operation] = measure(func, operation, args.iterations, args.users)
+            close()
+
+        print()
+        for operation in ('point_read', 'upsert', 'aggregate'):
+            print(f"   📊 {operation}")
+            print(f"      {'path':<12} {'p50 ms':>8} {'p95 ms':>8} {'cpu ms':>8} {'alloc KB':>9}")
+            for name, by_operation in results.items():
+                m = by_operation[operation]
+                print(f"      {name:<12} {m['p50_ms']:8.3f} {m['p95_ms']:8.3f} "
+                      f"{m['cpu_ms']:8.3f} {m['alloc_kb']:9.1f}")
+        print()
+
+        if results:
+            cheapest = min(results, key=lambda name: sum(m['p50_ms'] + m['cpu_ms'] for m in results[name].values()))
+            print(f"   💡 Lowest combined latency + client CPU: {cheapest}")
+            print()
+
+        if args.json:
+            with open(args.json, 'w') as f:
+                json.dump(results, f, indent=2)
+            print(f"   ✅ Results written to {args.json}")
+            print()
+
+        conn = psycopg2.connect(dsn)
+        conn.autocommit = True
+        conn.cursor().execute(f"DROP SCHEMA {SCHEMA} CASCADE;")
+        conn.close()
+
+        print("🎯 BENCHMARK COMPLETE!")
+        return True
+
+    except Exception as e:
+        print(f"❌ ERROR: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+    finally:
+        if server is not None:
+            server.terminate()
+
+
+if __name__ == "__main__":
+    import profiling
+    profiling.install()
+
+    success = run_benchmark(sys.argv[1:])
+    sys.exit(0 if success else 1)
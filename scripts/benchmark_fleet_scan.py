@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+
+"""
+Scaling benchmark for the fleet scan pipeline: 1..N parser workers
+Uses synthetic task lists, no database needed
+"""
+
+import os
+import sys
+import time
+
+from benchmark_task_store import synthetic_rows
+from fleet_scan import parse_chunk_to_store, scan_chunks
+from task_store import ColumnarTaskStore
+
+
+def make_chunks(rows, chunk_size):
+    table = [(row_id, user_id, content) for row_id, (user_id, content) in enumerate(rows, 1)]
+    return [table[i:i + chunk_size] for i in range(0, len(table), chunk_size)]
+
+
+def run_scan(chunks, workers):
+    store = ColumnarTaskStore()
+    start = time.perf_counter()
+    for partial in scan_chunks(iter(chunks), parse_chunk_to_store, workers):
+        store.extend(partial)
+    return store, time.perf_counter() - start
+
+
+def run_benchmark(users, tasks_per_user, max_workers, chunk_size=500, profiled=False):
+    print("⚙️  FLEET SCAN SCALING BENCHMARK")
+    print("=" * 60)
+    print(f"   Users: {users:,}  Tasks/user: {tasks_per_user}  Chunk size: {chunk_size}")
+    print(f"   CPUs available: {os.cpu_count()}")
+    if profiled:
+        # The 1-worker run parses in-process under cProfile/tracemalloc, pool workers don't
+        print("   ⚠️  --profile: timings are skewed, speedups not reported")
+    print()
+
+    chunks = make_chunks(synthetic_rows(users, tasks_per_user), chunk_size)
+
+    baseline = None
+    expected = None
+    for workers in range(1, max_workers + 1):
+        store, elapsed = run_scan(chunks, workers)
+        if baseline is None:
+            baseline = elapsed
+            expected = store.group_by('category')
+        elif store.group_by('category') != expected:
+            print(f"❌ Results with {workers} workers differ from the serial run")
+            return False
+
+        rate = len(store) / elapsed
+        speedup = "" if profiled else f"  speedup {baseline / elapsed:4.2f}x"
+        print(f"   {workers:>2} worker(s): {elapsed:6.2f}s  {rate:>10,.0f} tasks/s{speedup}")
+
+    print()
+    print("🎯 BENCHMARK COMPLETE!")
+    return True
+
+
+if __name__ == "__main__":
+    import profiling
+    profiled = profiling.install()
+
+    users = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    tasks_per_user = int(sys.argv[2]) if len(sys.argv) > 2 else 30
+    max_workers = int(sys.argv[3]) if len(sys.argv) > 3 else (os.cpu_count() or 1)
+    success = run_benchmark(users, tasks_per_user, max_workers, profiled=profiled)
+    sys.exit(0 if success else 1)
@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+
+"""
+RLS policy overhead benchmark: auth.uid()::text vs (select auth.uid())::text
+Runs against a LOCAL Postgres with a stand-in auth.uid() driven by the
+request.jwt.claim.sub GUC (same setting Supabase's auth.uid() reads).
+Optionally writes a migration that switches the policies to the initplan form.
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from datetime import datetime
+
+import psycopg2
+from dotenv import load_dotenv
+
+SCHEMA = 'rls_bench'
+ROLE = 'rls_bench_user'
+DEFAULT_DSN = 'postgresql://postgres@localhost:5432/postgres'
+
+# Policy expressions being compared (each is tested against user_id)
+# 'current' is the per-row form deployed before the migration; supabase-schema.sql
+# and db_operations.py create now define the initplan form
+FORMS = {
+    'current': 'auth.uid()::text',
+    'initplan': '(select auth.uid())::text',
+}
+
+# (table, policy name, command, has USING, has WITH CHECK) - mirrors supabase-schema.sql
+POLICIES = [
+    ('todoapp_tasks', 'Users can view their own tasks', 'SELECT', True, False),
+    ('todoapp_tasks', 'Users can insert their own tasks', 'INSERT', False, True),
+    ('todoapp_tasks', 'Users can update their own tasks', 'UPDATE', True, True),
+    ('todoapp_tasks', 'Users can delete their own tasks', 'DELETE', True, False),
+    ('todoapp_prompts', 'Users can view their own prompts', 'SELECT', True, False),
+    ('todoapp_prompts', 'Users can insert their own prompts', 'INSERT', False, True),
+    ('todoapp_prompts', 'Users can update their own prompts', 'UPDATE', True, True),
+    ('todoapp_prompts', 'Users can delete their own prompts', 'DELETE', True, False),
+]
+
+# Same body as Supabase's auth.uid(), so plans match production
+AUTH_UID_STANDIN = """
+    CREATE FUNCTION auth.uid() RETURNS uuid
+    LANGUAGE sql STABLE
+    AS $$
+      SELECT coalesce(
+        nullif(current_setting('request.jwt.claim.sub', true), ''),
+        (nullif(current_setting('request.jwt.claims', true), '')::jsonb ->> 'sub')
+      )::uuid
+    $$;
+"""
+
+# name -> (sql, planner settings). seq_scan disables index paths to expose the
+# per-row cost of the policy when it can't be served by the user_id index.
+WORKLOADS = {
+    'point_lookup': ("SELECT content FROM {table} WHERE user_id = %(uid)s;", []),
+    'point_update': ("UPDATE {table} SET updated_at = NOW() WHERE user_id = %(uid)s;", []),
+    'latest_by_updated_at': ("SELECT content FROM {table} ORDER BY updated_at DESC LIMIT 1;", []),
+    'seq_scan': ("SELECT COUNT(*) FROM {table};",
+                 ['enable_indexscan', 'enable_indexonlyscan', 'enable_bitmapscan']),
+}
+WARMUP = 5
+
+
+def policy_sql(table, name, command, using, check, expression, action='CREATE'):
+    """
+    CREATE POLICY / ALTER POLICY statement for one policy
+    """
+    clauses = []
+    if using:
+        clauses.append(f"USING ({expression} = user_id)")
+    if check:
+        clauses.append(f"WITH CHECK ({expression} = user_id)")
+    head = f'{action} POLICY "{name}"\n  ON {table}'
+    if action == 'CREATE':
+        head += f"\n  FOR {command}"
+    return head + '\n  ' + '\n  '.join(clauses) + ';'
+
+
+def setup(cur, users):
+    print("1️⃣ Preparing benchmark schema...")
+    start_time = time.time()
+
+    cur.execute("CREATE SCHEMA IF NOT EXISTS auth;")
+    cur.execute("SELECT 1 FROM pg_proc p JOIN pg_namespace n ON n.oid = p.pronamespace "
+                "WHERE n.nspname = 'auth' AND p.proname = 'uid';")
+    if cur.fetchone() is None:
+        cur.execute(AUTH_UID_STANDIN)
+        print("   🔧 Created stand-in auth.uid()")
+
+    cur.execute("SELECT 1 FROM pg_roles WHERE rolname = %s;", (ROLE,))
+    if cur.fetchone() is None:
+        cur.execute(f"CREATE ROLE {ROLE} NOLOGIN;")
+    cur.execute(f"GRANT USAGE ON SCHEMA auth TO {ROLE};")
+    cur.execute(f"GRANT EXECUTE ON FUNCTION auth.uid() TO {ROLE};")
+
+    cur.execute(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE;")
+    cur.execute(f"CREATE SCHEMA {SCHEMA};")
+    cur.execute(f"GRANT USAGE ON SCHEMA {SCHEMA} TO {ROLE};")
+
+    for form, expression in FORMS.items():
+        table = f"{SCHEMA}.tasks_{form}"
+        cur.execute(f"""
+            CREATE TABLE {table} (
+              id BIGSERIAL PRIMARY KEY,
+              user_id TEXT NOT NULL,
+              content TEXT NOT NULL,
+              updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+              created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+            );
+        """)
+        cur.execute(f"""
+            INSERT INTO {table} (user_id, content)
+            SELECT md5(i::text)::uuid::text, repeat('| 1 | Work | | task | to_do | white |', 8)
+            FROM generate_series(1, %s) AS i;
+        """, (users,))
+        cur.execute(f"CREATE UNIQUE INDEX ON {table}(user_id);")
+        cur.execute(f"CREATE INDEX ON {table}(updated_at DESC);")
+        cur.execute(f"ALTER TABLE {table} ENABLE ROW LEVEL SECURITY;")
+        for _, name, command, using, check in POLICIES[:4]:
+            cur.execute(policy_sql(table, name, command, using, check, expression))
+        cur.execute(f"GRANT SELECT, UPDATE ON {table} TO {ROLE};")
+        cur.execute(f"ANALYZE {table};")
+
+    duration = time.time() - start_time
+    print(f"   ✅ Seeded {users:,} users into {len(FORMS)} tables ({duration:.2f}s)")
+    print()
+
+
+def run_as_user(cur, uid, sql, params=None, disabled=()):
+    """
+    Execute sql as the RLS-restricted role for one user; returns (rows, seconds)
+    """
+    cur.execute("BEGIN;")
+    cur.execute(f"SET LOCAL ROLE {ROLE};")
+    for setting in disabled:
+        cur.execute(f"SET LOCAL {setting} = off;")
+    cur.execute("SELECT set_config('request.jwt.claim.sub', %s, true);", (uid,))
+    start = time.perf_counter()
+    cur.execute(sql, params)
+    rows = cur.fetchall() if cur.description else cur.rowcount
+    elapsed = time.perf_counter() - start
+    cur.execute("ROLLBACK;")
+    return rows, elapsed
+
+
+def plan_summary(cur, uid, sql, params, disabled):
+    """
+    Node types and whether auth.uid() became an InitPlan
+    """
+    rows, _ = run_as_user(cur, uid, "EXPLAIN (FORMAT JSON) " + sql, params, disabled)
+    plan = rows[0][0][0]
+    nodes = []
+    has_initplan = False
+
+    def walk(node):
+        nonlocal has_initplan
+        nodes.append(node['Node Type'])
+        if node.get('Parent Relationship') == 'InitPlan':
+            has_initplan = True
+        for child in node.get('Plans', []):
+            walk(child)
+
+    walk(plan['Plan'])
+    return has_initplan, nodes
+
+
+def benchmark(cur, users, iterations, tolerance, abs_tolerance):
+    cur.execute(f"SELECT user_id FROM {SCHEMA}.tasks_current ORDER BY random() LIMIT %s;",
+                (min(iterations, users),))
+    sample = [row[0] for row in cur.fetchall()]
+
+    print("2️⃣ Running workloads...")
+    timings = {}
+    equivalent = True
+    faster_or_equal = True
+
+    for workload, (template, disabled) in WORKLOADS.items():
+        results = {}
+        for form in FORMS:
+            table = f"{SCHEMA}.tasks_{form}"
+            sql = template.format(table=table)
+            per_query = []
+            outputs = []
+            for n in range(WARMUP):
+                uid = sample[n % len(sample)]
+                run_as_user(cur, uid, sql, {'uid': uid}, disabled)
+            for n in range(iterations):
+                uid = sample[n % len(sample)]
+                rows, elapsed = run_as_user(cur, uid, sql, {'uid': uid}, disabled)
+                per_query.append(elapsed)
+                outputs.append(rows)
+            has_initplan, nodes = plan_summary(cur, sample[0], sql, {'uid': sample[0]}, disabled)
+            results[form] = (outputs, statistics.median(per_query), has_initplan, nodes)
+
+        current, initplan = results['current'], results['initplan']
+        same = current[0] == initplan[0]
+        equivalent &= same
+        # The extra InitPlan node costs a few microseconds on point queries, so
+        # differences below abs_tolerance don't block the migration
+        faster_or_equal &= initplan[1] <= max(current[1] * (1 + tolerance), current[1] + abs_tolerance)
+        timings[workload] = (current[1], initplan[1])
+
+        print(f"   📊 {workload}")
+        for form, (_, median, has_initplan, nodes) in results.items():
+            print(f"      {form:<9} median {median * 1000:8.3f}ms  "
+                  f"initplan={'yes' if has_initplan else 'no ':<3}  plan: {' > '.join(nodes)}")
+        print(f"      results identical: {'✅' if same else '❌'}  "
+              f"speedup: {current[1] / max(initplan[1], 1e-9):.1f}x")
+    print()
+    return equivalent, faster_or_equal, timings
+
+
+def write_migration(directory, timings):
+    os.makedirs(directory, exist_ok=True)
+    stamp = datetime.now().strftime('%Y%m%d%H%M%S')
+    path = os.path.join(directory, f"{stamp}_rls_initplan_policies.sql")
+
+    lines = [
+        "-- Switch RLS policies to the initplan form: (select auth.uid())::text",
+        "-- auth.uid() is then evaluated once per statement instead of once per row.",
+        "-- supabase-schema.sql and db_operations.py create already use this form;",
+        "-- this brings databases created before them in line.",
+        "-- Generated by benchmark_rls.py; median timings (current -> initplan):",
+    ]
+    for workload, (current, initplan) in timings.items():
+        lines.append(f"--   {workload}: {current * 1000:.3f}ms -> {initplan * 1000:.3f}ms")
+    lines += ["", "BEGIN;", ""]
+    for table, name, command, using, check in POLICIES:
+        lines.append(policy_sql(table, name, command, using, check, FORMS['initplan'], action='ALTER'))
+        lines.append("")
+    lines.append("COMMIT;")
+
+    with open(path, 'w') as f:
+        f.write('\n'.join(lines) + '\n')
+    return path
+
+
+def run_benchmark(argv):
+    parser = argparse.ArgumentParser(prog='benchmark_rls.py')
+    parser.add_argument('--dsn', help='Local Postgres DSN (default: RLS_BENCH_CONNECTION_STRING)')
+    parser.add_argument('--users', type=int, default=100000, help='Rows to seed per table')
+    parser.add_argument('--iterations', type=int, default=200, help='Queries per workload and form')
+    parser.add_argument('--tolerance', type=float, default=0.10,
+                        help='Allowed relative slowdown of the initplan form before refusing the migration')
+    parser.add_argument('--abs-tolerance-ms', type=float, default=0.05,
+                        help='Allowed absolute slowdown per query (ms)')
+    parser.add_argument('--write-migration', action='store_true',
+                        help='Write migrations/<timestamp>_rls_initplan_policies.sql if confirmed')
+    parser.add_argument('--keep', action='store_true', help='Keep the rls_bench schema afterwards')
+    args = parser.parse_args(argv)
+
+    load_dotenv('.env.local')
+    dsn = args.dsn or os.getenv('RLS_BENCH_CONNECTION_STRING', DEFAULT_DSN)
+
+    try:
+        print("🛡️  RLS POLICY BENCHMARK")
+        print("=" * 60)
+        print(f"📍 {dsn.split('@')[-1]}")
+        print()
+
+        conn = psycopg2.connect(dsn)
+        conn.autocommit = True
+        cur = conn.cursor()
+
+        setup(cur, args.users)
+        equivalent, faster_or_equal, timings = benchmark(
+            cur, args.users, args.iterations, args.tolerance, args.abs_tolerance_ms / 1000)
+
+        if not args.keep:
+            cur.execute(f"DROP SCHEMA {SCHEMA} CASCADE;")
+        cur.close()
+        conn.close()
+
+        print("3️⃣ Verdict...")
+        if not equivalent:
+            print("   ❌ Policy forms returned different results - not generating a migration")
+            return False
+        if not faster_or_equal:
+            print("   ⚠️  initplan form was not faster on every workload - not generating a migration")
+            return True
+
+        print("   ✅ Results identical and initplan form is at least as fast")
+        if args.write_migration:
+            path = write_migration('migrations', timings)
+            print(f"   📝 Migration written: {path}")
+        else:
+            print("   💡 Re-run with --write-migration to generate the migration")
+        print()
+        print("🎯 BENCHMARK COMPLETE!")
+        return True
+
+    except Exception as e:
+        print(f"❌ ERROR: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+if __name__ == "__main__":
+    import profiling
+    profiling.install()
+
+    success = run_benchmark(sys.argv[1:])
+    sys.exit(0 if success else 1)
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+
+"""
+Memory / speed benchmark: ColumnarTaskStore vs dict-of-dicts
+Uses synthetic task lists, no database needed
+"""
+
+import gc
+import random
+import sys
+import time
+import tracemalloc
+from collections import Counter
+
+from markdown_parser import TASK_COLORS, parse_markdown_table
+from task_store import ColumnarTaskStore
+
+CATEGORIES = ['Work', 'Home', 'Health', 'Finance', 'Learning', 'Errands', 'Side Project', 'Social']
+SUBCATEGORIES = ['', 'Email', 'Meetings', 'Bills', 'Gym', 'Reading', 'Groceries', 'Calls']
+STATUSES = ['to_do', 'in_progress', 'blocked', 'done']
+
+
+def synthetic_content(rng, task_count):
+    """
+    Build one user's markdown blob in the format tasksToMarkdown() writes
+    """
+    lines = [
+        '| P | Category | Subcategory | Task | Status | Color | Created | Updated |',
+        '|---|----------|-------------|------|--------|-------|---------|----------|',
+    ]
+    for priority in range(1, task_count + 1):
+        created = f"2025-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}"
+        lines.append(
+            f"| {priority} | {rng.choice(CATEGORIES)} | {rng.choice(SUBCATEGORIES)} | "
+            f"Task {priority} {rng.getrandbits(32):08x} | {rng.choice(STATUSES)} | "
+            f"{rng.choice(TASK_COLORS)} | {created} | {created} |"
+        )
+    return '\n'.join(lines) + '\n'
+
+
+def synthetic_rows(users, tasks_per_user, seed=42):
+    rng = random.Random(seed)
+    return [(f"user_{n:07d}", synthetic_content(rng, tasks_per_user)) for n in range(users)]
+
+
+def measure(build, trace=True):
+    """
+    Load time from an untraced build, retained bytes from a traced one
+    (tracemalloc slows allocation-heavy code down several times)
+    trace=False skips the traced build and returns None for the bytes
+    """
+    gc.collect()
+    start = time.perf_counter()
+    result = build()
+    elapsed = time.perf_counter() - start
+    if not trace:
+        return result, None, elapsed
+
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, current, elapsed
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def _megabytes(size):
+    return f"{size / 1e6:,.1f} MB" if size is not None else "n/a"
+
+
+def run_benchmark(users, tasks_per_user, profiled=False):
+    print("📏 TASK STORE MEMORY BENCHMARK")
+    print("=" * 60)
+    print(f"   Users: {users:,}  Tasks/user: {tasks_per_user}  Total: {users * tasks_per_user:,}")
+    if profiled:
+        # --profile already runs tracemalloc for the whole process, so a nested
+        # start/stop would count earlier allocations and end the profiler's tracing
+        print("   ⚠️  --profile: memory not measured, load times include profiler overhead")
+    print()
+
+    rows = synthetic_rows(users, tasks_per_user)
+
+    def build_dicts():
+        return {user_id: parse_markdown_table(content) for user_id, content in rows}
+
+    def build_columnar(keep_text):
+        store = ColumnarTaskStore(keep_text=keep_text)
+        for user_id, content in rows:
+            store.append_content(user_id, content)
+        return store
+
+    print("1️⃣ Loading dict-of-dicts...")
+    dicts, dict_bytes, dict_load = measure(build_dicts, trace=not profiled)
+    print(f"   Memory: {_megabytes(dict_bytes)}  Load: {dict_load:.2f}s")
+    print()
+
+    # Like-for-like: the dicts keep every id and task text, so does this store
+    print("2️⃣ Loading ColumnarTaskStore(keep_text=True) - same fields as the dicts...")
+    store, store_bytes, store_load = measure(lambda: build_columnar(True), trace=not profiled)
+    print(f"   Memory: {_megabytes(store_bytes)}  Load: {store_load:.2f}s")
+    if not profiled:
+        print(f"   Ratio: {dict_bytes / max(store_bytes, 1):.1f}x smaller than dict-of-dicts")
+    print()
+
+    print("   ColumnarTaskStore(keep_text=False) - no id/task text, as analytics loads it...")
+    _, lean_bytes, lean_load = measure(lambda: build_columnar(False), trace=not profiled)
+    print(f"   Memory: {_megabytes(lean_bytes)}  Load: {lean_load:.2f}s")
+    print()
+
+    print("3️⃣ Filter: color == 'red' and status == 'to_do'")
+    dict_hits, dict_filter = timed(lambda: [
+        task for tasks in dicts.values() for task in tasks
+        if task['color'] == 'red' and task['status'] == 'to_do'
+    ])
+    store_hits, store_filter = timed(lambda: store.filter(color='red', status='to_do'))
+    print(f"   dict-of-dicts: {len(dict_hits):,} rows in {dict_filter * 1000:.1f}ms")
+    print(f"   columnar:      {len(store_hits):,} rows in {store_filter * 1000:.1f}ms")
+    print()
+
+    print("4️⃣ Group by category")
+    dict_groups, dict_group = timed(lambda: Counter(
+        task['category'] for tasks in dicts.values() for task in tasks
+    ))
+    store_groups, store_group = timed(lambda: store.group_by('category'))
+    assert dict(dict_groups) == store_groups
+    print(f"   dict-of-dicts: {dict_group * 1000:.1f}ms")
+    print(f"   columnar:      {store_group * 1000:.1f}ms")
+    print()
+
+    print("🎯 BENCHMARK COMPLETE!")
+    return True
+
+
+if __name__ == "__main__":
+    import profiling
+    profiled = profiling.install()
+
+    users = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    tasks_per_user = int(sys.argv[2]) if len(sys.argv) > 2 else 30
+    success = run_benchmark(users, tasks_per_user, profiled=profiled)
+    sys.exit(0 if success else 1)
@@ -49,7 +49,8 @@ def create_tables():
               user_id TEXT NOT NULL,
               content TEXT NOT NULL,
               updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
-              created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+              created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+              timezone TEXT
             );
         """)
         
@@ -85,34 +86,34 @@ def create_tables():
             DROP POLICY IF EXISTS "Users can delete their own tasks" ON todoapp_tasks;
         """)
         
-        # Create new policies
+        # Create new policies ((select auth.uid()) form, same as supabase-schema.sql)
         cur.execute("""
             CREATE POLICY "Users can view their own tasks"
               ON todoapp_tasks
               FOR SELECT
-              USING (auth.uid()::text = user_id);
+              USING ((select auth.uid())::text = user_id);
         """)
         
         cur.execute("""
             CREATE POLICY "Users can insert their own tasks"
               ON todoapp_tasks
               FOR INSERT
-              WITH CHECK (auth.uid()::text = user_id);
+              WITH CHECK ((select auth.uid())::text = user_id);
         """)
         
         cur.execute("""
             CREATE POLICY "Users can update their own tasks"
               ON todoapp_tasks
               FOR UPDATE
-              USING (auth.uid()::text = user_id)
-              WITH CHECK (auth.uid()::text = user_id);
+              USING ((select auth.uid())::text = user_id)
+              WITH CHECK ((select auth.uid())::text = user_id);
         """)
         
         cur.execute("""
             CREATE POLICY "Users can delete their own tasks"
               ON todoapp_tasks
               FOR DELETE
-              USING (auth.uid()::text = user_id);
+              USING ((select auth.uid())::text = user_id);
         """)
         
         print("   ✅ RLS policies created successfully")
@@ -153,9 +154,38 @@ def create_tables():
         traceback.print_exc()
         return False
 
-def query_database():
+def collect_query_report(cur):
+    """
+    Run the query_database() report queries and return plain data
+    """
+    cur.execute("SELECT COUNT(*) FROM todoapp_tasks;")
+    count = cur.fetchone()[0]
+    
+    report = {'count': count, 'recent': [], 'user_stats': []}
+    if count > 0:
+        cur.execute("""
+            SELECT id, user_id, LEFT(content, 50) as content_preview, 
+                   created_at, updated_at
+            FROM todoapp_tasks 
+            ORDER BY created_at DESC 
+            LIMIT 5;
+        """)
+        report['recent'] = cur.fetchall()
+        
+        cur.execute("""
+            SELECT user_id, COUNT(*) as task_count
+            FROM todoapp_tasks
+            GROUP BY user_id
+            ORDER BY task_count DESC;
+        """)
+        report['user_stats'] = cur.fetchall()
+    
+    return report
+
+def query_database(use_cache=True):
     """
     Query database and show results
+    Results are reused from the report cache while todoapp_tasks is unchanged
     """
     try:
         conn = get_database_connection()
@@ -165,26 +195,27 @@ def query_database():
         print("=" * 60)
         print()
         
+        start_time = time.time()
+        if use_cache:
+            from report_cache import ReportCache, freshness_fingerprint
+            report, hit = ReportCache().get_or_compute(
+                'query_database', freshness_fingerprint(cur), lambda: collect_query_report(cur))
+        else:
+            report, hit = collect_query_report(cur), False
+        duration = time.time() - start_time
+        print(f"⚡ {'Cached result (unchanged since last run)' if hit else 'Computed'} ({duration:.2f}s)")
+        print()
+        
         # Get table info
         print("1️⃣ Table statistics...")
-        cur.execute("SELECT COUNT(*) FROM todoapp_tasks;")
-        count = cur.fetchone()[0]
+        count = report['count']
         print(f"   Total rows: {count}")
         print()
         
         if count > 0:
             # Get recent tasks
             print("2️⃣ Recent tasks (last 5)...")
-            cur.execute("""
-                SELECT id, user_id, LEFT(content, 50) as content_preview, 
-                       created_at, updated_at
-                FROM todoapp_tasks 
-                ORDER BY created_at DESC 
-                LIMIT 5;
-            """)
-            
-            rows = cur.fetchall()
-            for row in rows:
+            for row in report['recent']:
                 print(f"   ID {row[0]}: {row[1]}")
                 print(f"      Content: {row[2]}...")
                 print(f"      Created: {row[3]}")
@@ -192,15 +223,7 @@ def query_database():
             
             # User statistics
             print("3️⃣ User statistics...")
-            cur.execute("""
-                SELECT user_id, COUNT(*) as task_count
-                FROM todoapp_tasks
-                GROUP BY user_id
-                ORDER BY task_count DESC;
-            """)
-            
-            user_stats = cur.fetchall()
-            for user_id, task_count in user_stats:
+            for user_id, task_count in report['user_stats']:
                 print(f"   User {user_id}: {task_count} task list(s)")
         else:
             print("   No tasks found in database")
@@ -263,13 +286,20 @@ def test_connection():
         return False
 
 if __name__ == "__main__":
+    import profiling
+    profiling.install()
+
     import sys
     
     if len(sys.argv) < 2:
         print("Usage:")
         print("  python3 db_operations.py test      # Test connection")
         print("  python3 db_operations.py create    # Create tables")
-        print("  python3 db_operations.py query     # Query database")
+        print("  python3 db_operations.py query     # Query database (--no-cache to bypass the report cache)")
+        print("  python3 db_operations.py analytics # Task analytics report (--output, --csv)")
+        print("  python3 db_operations.py reset-colors  # Color reset for users past their local midnight (hourly)")
+        print("  python3 db_operations.py archive   # Move stale users to the cold archive (--days N)")
+        print("  Add --profile to any command to write CPU/memory/network profiles to profiles/")
         print()
         sys.exit(1)
     
@@ -280,7 +310,16 @@ if __name__ == "__main__":
     elif command == "create":
         success = create_tables()
     elif command == "query":
-        success = query_database()
+        success = query_database(use_cache='--no-cache' not in sys.argv[2:])
+    elif command == "analytics":
+        from task_analytics import run_analytics
+        success = run_analytics(sys.argv[2:])
+    elif command == "reset-colors":
+        from reset_colors import run_color_reset
+        success = run_color_reset(sys.argv[2:])
+    elif command == "archive":
+        from archive_users import run_archive
+        success = run_archive(sys.argv[2:])
     else:
         print(f"Unknown command: {command}")
         success = False
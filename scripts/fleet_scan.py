@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+
+"""
+Multi-core fleet scan pipeline
+Server-side cursor -> chunks -> ProcessPoolExecutor of markdown parsers -> ordered results
+"""
+
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from markdown_parser import parse_markdown_rows
+from task_store import ColumnarTaskStore
+
+SCAN_QUERY = "SELECT id, user_id, content FROM todoapp_tasks ORDER BY id;"
+
+
+def fleet_query(conn, columns=('id', 'user_id', 'content')):
+    """
+    SELECT columns for every user, hot or archived (archive_users.py), in id order
+    Archived users are included under their original id; an archive row
+    shadowed by a hot row (a rehydrate that lost a race to a save) is skipped.
+    Falls back to todoapp_tasks alone when the archive table does not exist.
+    """
+    cur = conn.cursor()
+    cur.execute("SELECT to_regclass('todoapp_tasks_archive') IS NOT NULL;")
+    has_archive = cur.fetchone()[0]
+    cur.close()
+
+    hot = ', '.join(columns)
+    if not has_archive:
+        return f"SELECT {hot} FROM todoapp_tasks ORDER BY id;"
+
+    cold = ', '.join('a.source_id' if column == 'id' else f"a.{column}" for column in columns)
+    return f"""
+        SELECT {hot} FROM (
+          SELECT id AS scan_id, {hot} FROM todoapp_tasks
+          UNION ALL
+          SELECT a.source_id, {cold} FROM todoapp_tasks_archive a
+          WHERE NOT EXISTS (SELECT 1 FROM todoapp_tasks t WHERE t.user_id = a.user_id)
+        ) fleet
+        ORDER BY scan_id;
+    """
+
+
+def read_chunks(conn, chunk_size=500, query=SCAN_QUERY, cursor_name='fleet_scan'):
+    """
+    Yield lists of (id, user_id, content) rows from a named (server-side) cursor
+    Only one chunk per fetch is held client-side
+    """
+    cur = conn.cursor(name=cursor_name)
+    cur.itersize = chunk_size
+    cur.execute(query)
+    try:
+        while True:
+            chunk = cur.fetchmany(chunk_size)
+            if not chunk:
+                break
+            yield chunk
+    finally:
+        cur.close()
+
+
+def parse_chunk(chunk):
+    """
+    Worker: [(id, user_id, rows)] with rows from parse_markdown_rows()
+    """
+    return [(row_id, user_id, parse_markdown_rows(content)) for row_id, user_id, content in chunk]
+
+
+def parse_chunk_to_store(chunk):
+    """
+    Worker: one ColumnarTaskStore per chunk (compact to pickle back)
+    """
+    store = ColumnarTaskStore()
+    for _, user_id, content in chunk:
+        store.append_content(user_id, content)
+    return store
+
+
+def scan_chunks(chunks, worker=parse_chunk, workers=None, max_pending=None):
+    """
+    Run worker over chunks on a process pool, yielding results in input order
+
+    At most max_pending chunks are in flight; the chunk source is not read
+    further until the oldest result has been consumed (backpressure).
+    workers=1 runs inline without a pool.
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        for chunk in chunks:
+            yield worker(chunk)
+        return
+
+    max_pending = max_pending or workers * 2
+    pending = deque()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for chunk in chunks:
+            if len(pending) >= max_pending:
+                yield pending.popleft().result()
+            pending.append(executor.submit(worker, chunk))
+        while pending:
+            yield pending.popleft().result()
+
+
+def scan(conn, worker=parse_chunk, workers=None, chunk_size=500, max_pending=None, query=None):
+    """
+    Stream every user (hot and archived, see fleet_query) through the parsing pool
+    """
+    if query is None:
+        query = fleet_query(conn)
+    return scan_chunks(read_chunks(conn, chunk_size, query), worker, workers, max_pending)
+
+
+def scan_store(conn, workers=None, chunk_size=500, max_pending=None):
+    """
+    Parse every user's tasks into a single ColumnarTaskStore, in id order
+    """
+    store = ColumnarTaskStore()
+    for partial in scan(conn, parse_chunk_to_store, workers, chunk_size, max_pending):
+        store.extend(partial)
+    return store
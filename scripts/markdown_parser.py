@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+
+"""
+Python port of lib/markdown-parser.ts
+Parses the markdown task table stored in todoapp_tasks.content
+"""
+
+import re
+from datetime import datetime, timezone
+from functools import lru_cache
+
+TASK_COLORS = ['white', 'grey', 'red', 'blue']
+
+TASK_FIELDS = [
+    'id', 'priority', 'category', 'subcategory', 'task',
+    'status', 'color', 'created_at', 'updated_at',
+]
+
+_BR_RE = re.compile(r'<br\s*/?>', re.IGNORECASE)
+# parseInt(value, 10): optional sign + leading ASCII digits, rest ignored
+_LEADING_INT_RE = re.compile(r'[+-]?[0-9]+')
+
+
+def _js_char_codes(text):
+    """
+    UTF-16 code units, matching String.prototype.charCodeAt
+    """
+    if text.isascii():
+        return text.encode('ascii')
+    data = text.encode('utf-16-le', 'surrogatepass')
+    return memoryview(data).cast('H')
+
+
+def _js_substring(text, length):
+    if text.isascii():
+        return text[:length]
+    data = text.encode('utf-16-le', 'surrogatepass')[:length * 2]
+    return data.decode('utf-16-le', 'surrogatepass')
+
+
+@lru_cache(maxsize=4096)
+def parse_timestamp(value):
+    """
+    Parse a Created/Updated cell the way `new Date(value)` does
+    Returns epoch milliseconds, or None if the value is not a date
+    """
+    if not value:
+        return None
+    try:
+        if len(value) == 10:
+            # Date-only strings are treated as UTC by JS
+            parsed = datetime(int(value[:4]), int(value[5:7]), int(value[8:]), tzinfo=timezone.utc)
+        else:
+            parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+            if parsed.tzinfo is None:
+                parsed = parsed.astimezone()
+    except ValueError:
+        return None
+    return int(parsed.timestamp() * 1000)
+
+
+@lru_cache(maxsize=4096)
+def to_iso(epoch_ms):
+    """
+    Format epoch milliseconds like Date.prototype.toISOString
+    """
+    parsed = datetime.fromtimestamp(epoch_ms / 1000, tz=timezone.utc)
+    return parsed.strftime('%Y-%m-%dT%H:%M:%S.') + f"{epoch_ms % 1000:03d}Z"
+
+
+def generate_stable_id(created_ms, task, category):
+    """
+    Same djb2-based ID as generateStableId() in the TypeScript parser
+    """
+    content = f"{to_iso(created_ms)}|{_js_substring(task, 50)}|{category}"
+
+    # ((hash << 5) + hash) + c in JS reduces to hash * 33 + c modulo 2**32
+    hash_value = 5381
+    for code in _js_char_codes(content):
+        hash_value = (hash_value * 33 + code) & 0xFFFFFFFF
+
+    hash_str = format(hash_value, '08x')
+    return f"task-{created_ms:x}-{hash_str}"
+
+
+def _parse_color(value):
+    value = value.lower()
+    return value if value in TASK_COLORS else 'white'
+
+
+def parse_markdown_rows(markdown, now_ms=None):
+    """
+    Parse a markdown task table into tuples ordered like TASK_FIELDS
+    created_at / updated_at are epoch milliseconds
+    """
+    lines = markdown.strip().split('\n')
+    if len(lines) < 2:
+        return []
+
+    header_position = next((i for i, line in enumerate(lines) if '| Category |' in line), None)
+    if header_position is None:
+        return []
+
+    if now_ms is None:
+        now_ms = int(datetime.now(timezone.utc).timestamp() * 1000)
+
+    headers = [h.strip().lower() for h in lines[header_position].split('|') if h.strip()]
+
+    def index_of(name):
+        return headers.index(name) if name in headers else -1
+
+    priority_index = index_of('p')
+    category_index = index_of('category')
+    subcategory_index = index_of('subcategory')
+    task_index = index_of('task')
+    status_index = index_of('status')
+    color_index = index_of('color')
+    # Legacy support: check for 'today' column in old data
+    today_index = index_of('today')
+    created_index = index_of('created')
+    updated_index = index_of('updated')
+
+    rows = []
+    seen_ids = set()
+
+    for index, line in enumerate(lines[header_position + 2:]):
+        if not line.startswith('|'):
+            continue
+        raw_parts = line.split('|')
+
+        if len(raw_parts) < 10:
+            # Fall back to simple parsing for short lines
+            parts = [p.strip() for p in raw_parts]
+
+            def get_value(idx):
+                return parts[idx + 1] if idx != -1 and idx + 1 < len(parts) else ''
+
+            priority_val = get_value(priority_index)
+            category = get_value(category_index)
+            subcategory = get_value(subcategory_index)
+            task_text = get_value(task_index)
+            status = get_value(status_index)
+            created_val = get_value(created_index)
+            updated_val = get_value(updated_index)
+
+            if color_index != -1:
+                color = _parse_color(get_value(color_index))
+            elif today_index != -1 and get_value(today_index).lower() == 'yes':
+                color = 'red'
+            else:
+                color = 'white'
+        else:
+            # Smart parsing: known columns from both ends, Task is the middle
+            priority_val = raw_parts[1].strip()
+            category = raw_parts[2].strip()
+            subcategory = raw_parts[3].strip()
+            status = raw_parts[-5].strip()
+            color = _parse_color(raw_parts[-4].strip())
+            created_val = raw_parts[-3].strip()
+            updated_val = raw_parts[-2].strip()
+            task_text = '|'.join(raw_parts[4:-5]).strip()
+
+        task_text = _BR_RE.sub('\n', task_text)
+
+        match = _LEADING_INT_RE.match(priority_val)
+        priority = int(match.group()) if match else index + 1
+
+        created_at = parse_timestamp(created_val)
+        if created_at is None:
+            created_at = now_ms
+        updated_at = parse_timestamp(updated_val)
+        if updated_at is None:
+            updated_at = created_at
+
+        task_id = generate_stable_id(created_at, task_text, category)
+
+        # Deduplicate by ID - keep first occurrence (lowest priority)
+        if task_id in seen_ids:
+            continue
+        seen_ids.add(task_id)
+
+        rows.append((task_id, priority, category, subcategory, task_text,
+                     status, color, created_at, updated_at))
+
+    return rows
+
+
+def parse_markdown_table(markdown, now_ms=None):
+    """
+    Parse a markdown task table into a list of Task dicts
+    (same shape as the Task interface, ISO timestamps)
+    """
+    tasks = []
+    for row in parse_markdown_rows(markdown, now_ms):
+        task = dict(zip(TASK_FIELDS, row))
+        task['created_at'] = to_iso(task['created_at'])
+        task['updated_at'] = to_iso(task['updated_at'])
+        tasks.append(task)
+    return tasks
+
+
+def tasks_to_markdown(tasks):
+    """
+    Serialize Task dicts back to the markdown table format
+    """
+    markdown = '| P | Category | Subcategory | Task | Status | Color | Created | Updated |\n'
+    markdown += '|---|----------|-------------|------|--------|-------|---------|----------|\n'
+
+    for task in sorted(tasks, key=lambda t: t['priority']):
+        task_with_breaks = task['task'].replace('\n', '<br>')
+        created_date = task['created_at'][:10] if task.get('created_at') else ''
+        updated_date = task['updated_at'][:10] if task.get('updated_at') else ''
+        markdown += (f"| {task['priority']} | {task['category']} | {task['subcategory']} | "
+                     f"{task_with_breaks} | {task['status']} | {task['color']} | "
+                     f"{created_date} | {updated_date} |\n")
+
+    return markdown
@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+
+"""
+--profile support for the ops scripts
+profiling.install() at the top of a script's __main__ block strips --profile
+from sys.argv and, if it was given, runs the rest of the command under
+cProfile and tracemalloc. psycopg2 queries and requests/httpx calls are timed
+and their bytes counted. On exit, timestamped reports land in profiles/:
+
+  <name>-<timestamp>.pstats   cProfile data (python3 -m pstats <file>)
+  <name>-<timestamp>.txt      hot functions, network calls, top allocations
+  <name>-<timestamp>.json     headline numbers for `profiling.py compare`
+
+Only the main process is profiled; ProcessPoolExecutor workers are not.
+"""
+
+import atexit
+import cProfile
+import io
+import json
+import os
+import pstats
+import re
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from urllib.parse import urlsplit
+
+DEFAULT_DIRECTORY = 'profiles'
+TOP_FUNCTIONS = 40
+TOP_ALLOCATIONS = 25
+SLOWEST_CALLS = 15
+
+# One [kind, label, seconds, bytes_sent, bytes_received] list per network call
+network_calls = []
+
+
+def record_call(kind, label, seconds, sent=0, received=0):
+    call = [kind, label, seconds, sent, received]
+    network_calls.append(call)
+    return call
+
+
+def _payload_size(rows):
+    """
+    Approximate bytes on the wire for fetched rows (text columns dominate)
+    """
+    size = 0
+    for row in rows:
+        for value in row:
+            if isinstance(value, (str, bytes, memoryview)):
+                size += len(value)
+            elif value is not None:
+                size += 8
+    return size
+
+
+def _patch_psycopg2():
+    try:
+        import psycopg2
+        import psycopg2.extensions
+    except ImportError:
+        return
+
+    class ProfiledCursor(psycopg2.extensions.cursor):
+        """
+        Client-side cursors receive the whole result inside execute(), so
+        fetched bytes are added to that call; named (server-side) cursors
+        cross the network on every fetch and get their own record
+        """
+
+        _last_call = None
+
+        def execute(self, query, vars=None):
+            start = time.perf_counter()
+            try:
+                return super().execute(query, vars)
+            finally:
+                sent = len(self.query) if self.query else 0
+                label = ' '.join((self.query or b'').decode('utf-8', 'replace').split())[:80]
+                self._last_call = record_call('postgres', label, time.perf_counter() - start, sent)
+
+        def executemany(self, query, vars_list):
+            start = time.perf_counter()
+            try:
+                return super().executemany(query, vars_list)
+            finally:
+                label = ' '.join((self.query or b'').decode('utf-8', 'replace').split())[:80]
+                self._last_call = record_call('postgres', label, time.perf_counter() - start,
+                                              len(self.query) if self.query else 0)
+
+        def _fetched(self, rows, start):
+            if self.name is not None:
+                record_call('postgres', f'FETCH {self.name}', time.perf_counter() - start,
+                            received=_payload_size(rows))
+            elif self._last_call is not None:
+                self._last_call[4] += _payload_size(rows)
+            return rows
+
+        def fetchone(self):
+            start = time.perf_counter()
+            row = super().fetchone()
+            self._fetched([row] if row is not None else [], start)
+            return row
+
+        def fetchmany(self, size=None):
+            start = time.perf_counter()
+            rows = super().fetchmany(size) if size is not None else super().fetchmany()
+            return self._fetched(rows, start)
+
+        def fetchall(self):
+            start = time.perf_counter()
+            return self._fetched(super().fetchall(), start)
+
+    connect = psycopg2.connect
+
+    def profiled_connect(*args, **kwargs):
+        kwargs.setdefault('cursor_factory', ProfiledCursor)
+        start = time.perf_counter()
+        conn = connect(*args, **kwargs)
+        record_call('postgres', 'connect', time.perf_counter() - start)
+        return conn
+
+    psycopg2.connect = profiled_connect
+
+
+def _patch_requests():
+    try:
+        import requests
+    except ImportError:
+        return
+
+    send = requests.Session.send
+
+    def profiled_send(self, request, **kwargs):
+        start = time.perf_counter()
+        response = send(self, request, **kwargs)
+        seconds = time.perf_counter() - start
+        # Generator / file bodies have no len(); count only what we can size
+        body = request.body if isinstance(request.body, (bytes, str)) else b''
+        if kwargs.get('stream'):
+            received = int(response.headers.get('Content-Length', 0))
+        else:
+            received = len(response.content)
+        record_call('http', f"{request.method} {urlsplit(request.url).path}", seconds,
+                    len(body), received)
+        return response
+
+    requests.Session.send = profiled_send
+
+
+def _patch_httpx():
+    # supabase-py talks to PostgREST through httpx
+    try:
+        import httpx
+    except ImportError:
+        return
+
+    send = httpx.Client.send
+
+    def profiled_send(self, request, **kwargs):
+        start = time.perf_counter()
+        response = send(self, request, **kwargs)
+        seconds = time.perf_counter() - start
+        sent = int(request.headers.get('Content-Length', 0))
+        record_call('http', f"{request.method} {request.url.path}", seconds,
+                    sent, response.num_bytes_downloaded)
+        return response
+
+    httpx.Client.send = profiled_send
+
+
+def _network_summary(wall):
+    lines = []
+    totals = {}
+    for kind, _, seconds, sent, received in network_calls:
+        total = totals.setdefault(kind, [0, 0.0, 0, 0])
+        total[0] += 1
+        total[1] += seconds
+        total[2] += sent
+        total[3] += received
+
+    lines.append(f"{'kind':<10} {'calls':>8} {'seconds':>10} {'% wall':>7} {'sent KB':>10} {'recv KB':>10}")
+    for kind, (calls, seconds, sent, received) in sorted(totals.items()):
+        lines.append(f"{kind:<10} {calls:>8,} {seconds:>10.3f} {seconds / wall:>7.1%} "
+                     f"{sent / 1024:>10,.1f} {received / 1024:>10,.1f}")
+
+    lines.append('')
+    lines.append(f"Slowest {SLOWEST_CALLS} calls:")
+    for kind, label, seconds, sent, received in sorted(network_calls, key=lambda c: -c[2])[:SLOWEST_CALLS]:
+        lines.append(f"  {seconds * 1000:>9.2f} ms  {sent:>9,} B out  {received:>11,} B in  {kind}: {label}")
+    return lines, totals
+
+
+def _write_reports(name, directory, profiler, wall_start, cpu_start):
+    profiler.disable()
+    wall = time.perf_counter() - wall_start
+    cpu = time.process_time() - cpu_start
+    # The memory benchmarks start/stop tracemalloc themselves, which drops our traces
+    snapshot = peak = None
+    if tracemalloc.is_tracing():
+        snapshot = tracemalloc.take_snapshot().filter_traces([
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+            tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+            tracemalloc.Filter(False, '<frozen importlib._bootstrap_external>'),
+        ])
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    memory = f"peak traced memory {peak / 1e6:,.1f} MB" if peak is not None else "memory not traced"
+
+    os.makedirs(directory, exist_ok=True)
+    base = os.path.join(directory, f"{name}-{datetime.now().strftime('%Y%m%d-%H%M%S')}")
+    profiler.dump_stats(f"{base}.pstats")
+
+    stream = io.StringIO()
+    pstats.Stats(profiler, stream=stream).sort_stats('cumulative').print_stats(TOP_FUNCTIONS)
+    network_lines, totals = _network_summary(wall)
+    network_seconds = sum(total[1] for total in totals.values())
+
+    with open(f"{base}.txt", 'w') as f:
+        f.write(f"{' '.join(sys.argv)}\n")
+        f.write(f"wall {wall:.3f}s, cpu {cpu:.3f}s, network {network_seconds:.3f}s, {memory}\n")
+        f.write("(timings include cProfile/tracemalloc overhead)\n\n")
+        f.write("=== Network ===\n")
+        f.write('\n'.join(network_lines))
+        f.write("\n\n=== Top allocations (live at exit) ===\n")
+        if snapshot is None:
+            f.write("unavailable: the command stopped tracemalloc itself\n")
+        else:
+            for stat in snapshot.statistics('lineno')[:TOP_ALLOCATIONS]:
+                f.write(f"{stat}\n")
+        f.write("\n=== CPU (cProfile, cumulative) ===\n")
+        f.write(stream.getvalue())
+
+    with open(f"{base}.json", 'w') as f:
+        json.dump({
+            'argv': sys.argv,
+            'started_at': datetime.fromtimestamp(time.time() - wall).isoformat(timespec='seconds'),
+            'wall_seconds': round(wall, 4),
+            'cpu_seconds': round(cpu, 4),
+            'peak_memory_bytes': peak,
+            'network': {kind: {'calls': calls, 'seconds': round(seconds, 4),
+                               'bytes_sent': sent, 'bytes_received': received}
+                        for kind, (calls, seconds, sent, received) in totals.items()},
+        }, f, indent=2)
+
+    print()
+    print(f"🔬 Profile: wall {wall:.2f}s, cpu {cpu:.2f}s, network {network_seconds:.2f}s "
+          f"({len(network_calls):,} calls), {memory}")
+    print(f"   {base}.txt / .pstats / .json")
+
+
+def install(name=None, directory=DEFAULT_DIRECTORY):
+    """
+    Enable profiling if --profile is in sys.argv (and remove it)
+    Returns True when profiling is active
+    """
+    if '--profile' not in sys.argv[1:]:
+        return False
+    sys.argv.remove('--profile')
+
+    if name is None:
+        name = os.path.splitext(os.path.basename(sys.argv[0]))[0]
+        if len(sys.argv) > 1 and re.fullmatch(r'[a-z][a-z-]*', sys.argv[1]):
+            name = f"{name}-{sys.argv[1]}"
+
+    _patch_psycopg2()
+    _patch_requests()
+    _patch_httpx()
+
+    tracemalloc.start()
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    profiler = cProfile.Profile()
+    atexit.register(_write_reports, name, directory, profiler, wall_start, cpu_start)
+    # Forked workers would otherwise inherit the profiler and tracing overhead
+    os.register_at_fork(after_in_child=lambda: (profiler.disable(), tracemalloc.stop()))
+    profiler.enable()
+    return True
+
+
+def compare(paths):
+    """
+    Print the headline numbers of saved profiles side by side, oldest first
+    """
+    runs = []
+    for path in paths:
+        with open(path) as f:
+            runs.append((path, json.load(f)))
+    runs.sort(key=lambda run: run[1]['started_at'])
+
+    print(f"{'profile':<48} {'wall s':>8} {'cpu s':>8} {'net s':>8} {'calls':>7} {'recv KB':>9} {'peak MB':>8}")
+    for path, run in runs:
+        network = run['network'].values()
+        print(f"{os.path.basename(path):<48} {run['wall_seconds']:>8.2f} {run['cpu_seconds']:>8.2f} "
+              f"{sum(n['seconds'] for n in network):>8.2f} {sum(n['calls'] for n in network):>7,} "
+              f"{sum(n['bytes_received'] for n in network) / 1024:>9,.1f} "
+              f"{run['peak_memory_bytes'] / 1e6 if run['peak_memory_bytes'] is not None else float('nan'):>8.1f}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 3 or sys.argv[1] != 'compare':
+        print("Usage:")
+        print("  python3 profiling.py compare profiles/<name>-*.json   # Compare saved runs")
+        print("  python3 -m pstats profiles/<name>-<timestamp>.pstats  # Browse one CPU profile")
+        print()
+        sys.exit(1)
+
+    compare(sys.argv[2:])
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+
+"""
+On-disk result cache for admin reports
+Entries expire after a TTL, are evicted least-recently-used, and are
+invalidated whenever the todoapp_tasks freshness fingerprint changes
+"""
+
+import hashlib
+import json
+import os
+import time
+
+DEFAULT_DIRECTORY = '.report_cache'
+
+
+def freshness_fingerprint(cur, table='todoapp_tasks'):
+    """
+    Cheap change detector: max(updated_at) (served by the updated_at index)
+    plus pg_stat_user_tables write counters, which also catch deletes
+    """
+    cur.execute(f"""
+        SELECT
+          (SELECT MAX(updated_at) FROM {table}),
+          s.n_tup_ins, s.n_tup_upd, s.n_tup_del
+        FROM pg_stat_user_tables s
+        WHERE s.relid = %s::regclass;
+    """, (table,))
+    row = cur.fetchone()
+    return '|'.join(str(value) for value in row) if row else None
+
+
+class ReportCache:
+    """
+    One JSON file per entry; file mtime doubles as the LRU clock
+    """
+
+    def __init__(self, directory=DEFAULT_DIRECTORY, ttl=3600, max_entries=64):
+        self.directory = directory
+        self.ttl = ttl
+        self.max_entries = max_entries
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key):
+        digest = hashlib.sha256(key.encode('utf-8')).hexdigest()[:32]
+        return os.path.join(self.directory, f"{digest}.json")
+
+    def get(self, key, fingerprint):
+        """
+        Cached value, or None if missing, expired or stale
+        """
+        path = self._path(key)
+        try:
+            with open(path) as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if entry.get('key') != key or entry.get('fingerprint') != fingerprint \
+                or time.time() - entry.get('created_at', 0) > self.ttl:
+            self._remove(path)
+            return None
+
+        os.utime(path)
+        return entry['value']
+
+    def put(self, key, fingerprint, value):
+        path = self._path(key)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump({'key': key, 'fingerprint': fingerprint,
+                       'created_at': time.time(), 'value': value}, f, default=str)
+        os.replace(tmp_path, path)
+        self.evict()
+
+    def get_or_compute(self, key, fingerprint, compute):
+        """
+        (value, hit) - compute() runs only on a miss
+        A None fingerprint (probe unavailable) always recomputes
+        """
+        if fingerprint is not None:
+            value = self.get(key, fingerprint)
+            if value is not None:
+                return value, True
+
+        # Round-trip through JSON so hits and misses return identical shapes
+        value = json.loads(json.dumps(compute(), default=str))
+        if fingerprint is not None:
+            self.put(key, fingerprint, value)
+        return value, False
+
+    def evict(self):
+        """
+        Drop least-recently-used entries beyond max_entries
+        """
+        entries = []
+        for name in os.listdir(self.directory):
+            if name.endswith('.json'):
+                path = os.path.join(self.directory, name)
+                try:
+                    entries.append((os.path.getmtime(path), path))
+                except OSError:
+                    continue
+        entries.sort()
+        for _, path in entries[:max(0, len(entries) - self.max_entries)]:
+            self._remove(path)
+
+    def clear(self):
+        for name in os.listdir(self.directory):
+            self._remove(os.path.join(self.directory, name))
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
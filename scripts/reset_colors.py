@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+
+"""
+Server-side daily color reset
+Same effect as resetColors() in app/page.tsx, done in the database in
+throttled id-range batches instead of one upload per client
+
+Users are reset at their own local midnight: the client stores its IANA
+timezone with every save (todoapp_tasks.timezone), and a row is only
+rewritten once it has not been saved since that user's last local midnight.
+Anyone active since then already got the client-side reset, so running this
+hourly only picks up idle users and never races an open tab.
+"""
+
+import argparse
+import time
+
+# Color cell of a task row: 4th cell from the end (| Color | Created | Updated |).
+# Newline-sensitive so $ matches at the end of every row.
+COLORED_ROW = r'\|[ \t]*(grey|red|blue)[ \t]*(\|[^|\n]*\|[^|\n]*\|[ \t\r]*)$'
+STANDARD_HEADER = '%| Status | Color | Created | Updated |%'
+
+# Rows in [start, end) that are stale for the user's local day and still colored.
+# z is the per-run zone -> local-midnight table from resolve_cutoffs(); unknown or
+# invalid timezones have no entry there and are skipped.
+STALE_COLORED_ROWS = """
+    unnest(%(zones)s::text[], %(cutoffs)s::timestamptz[]) AS z(name, cutoff)
+    WHERE z.name = COALESCE(t.timezone, %(default_timezone)s)
+      AND t.id >= %(start)s AND t.id < %(end)s
+      AND t.updated_at < z.cutoff
+      AND t.content LIKE %(header)s
+      AND t.content ~* ('(?n)' || %(pattern)s)
+"""
+
+
+def has_timezone_column(cur):
+    """
+    todoapp_tasks.timezone is written by POST /api/tasks and created by
+    supabase-schema.sql / db_operations.py create; the job never adds it
+    itself, since ALTER TABLE would queue every app query behind its lock
+    """
+    cur.execute("""
+        SELECT EXISTS (
+          SELECT 1 FROM information_schema.columns
+          WHERE table_schema = ANY(current_schemas(false))
+            AND table_name = 'todoapp_tasks'
+            AND column_name = 'timezone'
+        );
+    """)
+    return cur.fetchone()[0]
+
+
+def resolve_cutoffs(cur, default_timezone=None):
+    """
+    Last local midnight for every timezone in use, resolved once per run
+    pg_timezone_names re-reads the zoneinfo tree on every call, far too slow
+    to join in each batch
+    """
+    cur.execute("""
+        SELECT z.name, date_trunc('day', NOW() AT TIME ZONE z.name) AT TIME ZONE z.name
+        FROM (SELECT DISTINCT COALESCE(timezone, %s) AS name FROM todoapp_tasks) used
+        JOIN pg_timezone_names z ON z.name = used.name;
+    """, (default_timezone,))
+    rows = cur.fetchall()
+    return {'default_timezone': default_timezone,
+            'zones': [name for name, _ in rows],
+            'cutoffs': [cutoff for _, cutoff in rows]}
+
+
+def _batch_params(start_id, end_id, cutoffs):
+    return {'pattern': COLORED_ROW, 'start': start_id, 'end': end_id,
+            'header': STANDARD_HEADER, **cutoffs}
+
+
+def reset_batch(cur, start_id, end_id, time_budget, cutoffs):
+    """
+    Reset colors for ids in [start_id, end_id); returns rows updated
+    Rows without a colored task are not rewritten
+    """
+    # Hard cap well above the target so one slow batch can't hold row locks for long
+    cur.execute("SET LOCAL statement_timeout = %s;", (int(time_budget * 5000),))
+    cur.execute(f"""
+        UPDATE todoapp_tasks t
+        SET content = regexp_replace(t.content, %(pattern)s, '| white \\2', 'gin'),
+            updated_at = NOW()
+        FROM {STALE_COLORED_ROWS};
+    """, _batch_params(start_id, end_id, cutoffs))
+    return cur.rowcount
+
+
+def count_batch(cur, start_id, end_id, cutoffs):
+    cur.execute(f"SELECT COUNT(*) FROM todoapp_tasks t, {STALE_COLORED_ROWS};",
+                _batch_params(start_id, end_id, cutoffs))
+    return cur.fetchone()[0]
+
+
+def run_color_reset(argv):
+    """
+    reset-colors subcommand
+    """
+    parser = argparse.ArgumentParser(prog='db_operations.py reset-colors')
+    parser.add_argument('--batch-size', type=int, default=500, help='Initial id range per batch')
+    parser.add_argument('--max-batch-size', type=int, default=20000, help='Upper bound for adaptive batches')
+    parser.add_argument('--time-budget', type=float, default=0.25, help='Target seconds per batch')
+    parser.add_argument('--pause', type=float, default=0.05, help='Seconds to sleep between batches')
+    parser.add_argument('--dry-run', action='store_true', help='Only count rows that would change')
+    parser.add_argument('--default-timezone', metavar='TZ',
+                        help='IANA zone for users with no stored timezone (default: skip them)')
+    args = parser.parse_args(argv)
+
+    from psycopg2 import errors
+    from db_operations import get_database_connection
+
+    try:
+        print("🎨 DAILY COLOR RESET")
+        print("=" * 60)
+        print()
+
+        conn = get_database_connection()
+        cur = conn.cursor()
+
+        if not has_timezone_column(cur):
+            print("❌ todoapp_tasks.timezone is missing - apply the ALTER TABLE in supabase-schema.sql first")
+            cur.close()
+            conn.close()
+            return False
+
+        cur.execute("SELECT MIN(id), MAX(id), COUNT(*) FILTER (WHERE timezone IS NULL) FROM todoapp_tasks;")
+        min_id, max_id, without_timezone = cur.fetchone()
+        conn.commit()
+        if min_id is None:
+            print("   No tasks found in database")
+            return True
+        if without_timezone and not args.default_timezone:
+            print(f"   ⚠️  {without_timezone:,} users have no stored timezone yet; "
+                  f"the client resets them (or pass --default-timezone)")
+
+        cutoffs = resolve_cutoffs(cur, args.default_timezone)
+        conn.commit()
+
+        print(f"1️⃣ Scanning ids {min_id}..{max_id} across {len(cutoffs['zones'])} timezone(s)"
+              f"{' (dry run)' if args.dry_run else ''}")
+
+        start_time = time.time()
+        batch_size = args.batch_size
+        start_id = min_id
+        scanned = changed = batches = 0
+
+        while start_id <= max_id:
+            end_id = start_id + batch_size
+            batch_start = time.time()
+            try:
+                if args.dry_run:
+                    rows = count_batch(cur, start_id, end_id, cutoffs)
+                else:
+                    rows = reset_batch(cur, start_id, end_id, args.time_budget, cutoffs)
+                conn.commit()
+            except errors.QueryCanceled:
+                conn.rollback()
+                if batch_size == 1:
+                    raise
+                batch_size = max(1, batch_size // 2)
+                print(f"   ⚠️  Batch at id {start_id} hit the timeout, retrying with {batch_size} ids")
+                continue
+            elapsed = time.time() - batch_start
+
+            changed += rows
+            scanned += end_id - start_id
+            batches += 1
+            start_id = end_id
+
+            # Adapt the id range so each batch lands near the time budget
+            if elapsed > args.time_budget:
+                batch_size = max(1, batch_size // 2)
+            elif elapsed < args.time_budget / 2:
+                batch_size = min(args.max_batch_size, batch_size * 2)
+
+            if batches % 50 == 0:
+                rate = scanned / (time.time() - start_time)
+                print(f"   … id {start_id}: {changed:,} rows reset, {rate:,.0f} ids/s")
+
+            time.sleep(args.pause)
+
+        duration = time.time() - start_time
+        cur.close()
+        conn.close()
+
+        verb = "would be reset" if args.dry_run else "reset"
+        print(f"   ✅ {changed:,} rows {verb} in {batches:,} batches ({duration:.2f}s)")
+        print(f"   📊 {scanned / duration:,.0f} ids/s scanned, {changed / duration:,.0f} rows/s rewritten")
+        print()
+        print("🎯 COLOR RESET COMPLETE!")
+        return True
+
+    except Exception as e:
+        print(f"❌ ERROR: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
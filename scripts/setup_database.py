@@ -145,6 +145,9 @@ def setup_database():
         return False
 
 if __name__ == "__main__":
+    import profiling
+    profiling.install()
+
     success = setup_database()
     if success:
         print("✅ All database operations successful!")
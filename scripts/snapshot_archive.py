@@ -0,0 +1,379 @@
+#!/usr/bin/env python3
+
+"""
+Indexed snapshot archive of todoapp_tasks
+Per-user zlib frames + sorted user_id index, read via mmap + binary search
+
+Layout:
+  MAGIC
+  frame* (zlib-compressed content, one per user)
+  keys   (concatenated UTF-8 user_ids, in index order)
+  index  (ENTRY records sorted by user_id)
+  footer (FOOTER)
+"""
+
+import mmap
+import os
+import struct
+import sys
+import time
+import zlib
+from datetime import datetime, timezone
+
+MAGIC = b'TDSNAP01'
+
+# key_offset, key_len, frame_offset, frame_len, raw_len, crc32(content), updated_at_ms
+ENTRY = struct.Struct('<QIQIIIq')
+# index_offset, entry_count, keys_offset, crc32(keys + index), magic
+FOOTER = struct.Struct('<QQQI8s')
+
+
+class SnapshotEntry:
+    """
+    One user's row in a snapshot
+    """
+
+    __slots__ = ('user_id', 'content', 'updated_at')
+
+    def __init__(self, user_id, content, updated_at):
+        self.user_id = user_id
+        self.content = content
+        self.updated_at = updated_at  # epoch ms
+
+
+class SnapshotWriter:
+    """
+    Streams frames to path + '.tmp', writes the sorted index on close and
+    only then renames it into place; abort() (or an exception inside a with
+    block) discards the partial file so a truncated snapshot never looks valid
+    """
+
+    def __init__(self, path, level=6):
+        self.path = path
+        self.tmp_path = f"{path}.tmp"
+        self.level = level
+        self.file = open(self.tmp_path, 'wb')
+        self.file.write(MAGIC)
+        self.offset = len(MAGIC)
+        self.entries = []
+        self.seen = set()
+
+    def add(self, user_id, content, updated_at=0):
+        key = user_id.encode('utf-8')
+        if key in self.seen:
+            raise Exception(f"Duplicate user_id in snapshot: {user_id}")
+        self.seen.add(key)
+
+        raw = content.encode('utf-8')
+        frame = zlib.compress(raw, self.level)
+        self.file.write(frame)
+        self.entries.append((key, self.offset, len(frame), len(raw), zlib.crc32(raw), updated_at))
+        self.offset += len(frame)
+
+    def close(self):
+        if self.file is None:
+            return
+        self.entries.sort(key=lambda entry: entry[0])
+
+        keys_offset = self.offset
+        keys = bytearray()
+        index = bytearray()
+        for key, frame_offset, frame_len, raw_len, crc, updated_at in self.entries:
+            index += ENTRY.pack(keys_offset + len(keys), len(key), frame_offset, frame_len,
+                                raw_len, crc, updated_at)
+            keys += key
+
+        index_offset = keys_offset + len(keys)
+        self.file.write(keys)
+        self.file.write(index)
+        self.file.write(FOOTER.pack(index_offset, len(self.entries), keys_offset,
+                                    zlib.crc32(index, zlib.crc32(keys)), MAGIC))
+        self.file.close()
+        self.file = None
+        os.replace(self.tmp_path, self.path)
+
+    def abort(self):
+        if self.file is None:
+            return
+        self.file.close()
+        self.file = None
+        os.remove(self.tmp_path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+class SnapshotReader:
+    """
+    mmap-backed reader; lookups binary-search the index without loading it
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.file = open(path, 'rb')
+        self.mm = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self.mm) < len(MAGIC) + FOOTER.size or self.mm[:len(MAGIC)] != MAGIC:
+            self.close()
+            raise Exception(f"Not a snapshot file: {path}")
+
+        (self.index_offset, self.count, self.keys_offset,
+         self.index_crc, magic) = FOOTER.unpack_from(self.mm, len(self.mm) - FOOTER.size)
+        if magic != MAGIC or self.index_offset + self.count * ENTRY.size != len(self.mm) - FOOTER.size:
+            self.close()
+            raise Exception(f"Corrupt snapshot footer: {path}")
+
+    def __len__(self):
+        return self.count
+
+    def _entry(self, position):
+        return ENTRY.unpack_from(self.mm, self.index_offset + position * ENTRY.size)
+
+    def _key(self, entry):
+        return self.mm[entry[0]:entry[0] + entry[1]]
+
+    def find(self, user_id):
+        """
+        Index position of user_id, or -1
+        """
+        key = user_id.encode('utf-8')
+        lo, hi = 0, self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._key(self._entry(mid)) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self.count and self._key(self._entry(lo)) == key:
+            return lo
+        return -1
+
+    def read(self, position):
+        """
+        Decompress and checksum one entry
+        """
+        key_offset, key_len, frame_offset, frame_len, raw_len, crc, updated_at = self._entry(position)
+        user_id = self.mm[key_offset:key_offset + key_len].decode('utf-8')
+        raw = zlib.decompress(self.mm[frame_offset:frame_offset + frame_len])
+        if len(raw) != raw_len or zlib.crc32(raw) != crc:
+            raise Exception(f"Checksum mismatch for user {user_id}")
+        return SnapshotEntry(user_id, raw.decode('utf-8'), updated_at)
+
+    def get(self, user_id):
+        position = self.find(user_id)
+        return self.read(position) if position >= 0 else None
+
+    def __iter__(self):
+        for position in range(self.count):
+            yield self.read(position)
+
+    def verify(self):
+        """
+        Check the index checksum, key ordering and every frame
+        """
+        index_crc = zlib.crc32(self.mm[self.keys_offset:len(self.mm) - FOOTER.size])
+        if index_crc != self.index_crc:
+            raise Exception("Index checksum mismatch")
+        previous = None
+        for position in range(self.count):
+            entry = self.read(position)
+            if previous is not None and entry.user_id.encode('utf-8') <= previous:
+                raise Exception(f"Index out of order at {entry.user_id}")
+            previous = entry.user_id.encode('utf-8')
+        return True
+
+    def close(self):
+        self.mm.close()
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _epoch_ms(value):
+    return int(value.timestamp() * 1000) if value else 0
+
+
+def create_snapshot(path, chunk_size=1000):
+    """
+    Snapshot every user, including archived ones
+    """
+    from db_operations import get_database_connection
+    from fleet_scan import fleet_query, read_chunks
+
+    try:
+        print("📦 CREATING SNAPSHOT")
+        print("=" * 60)
+        print()
+
+        start_time = time.time()
+        conn = get_database_connection()
+        # Includes users moved to todoapp_tasks_archive so they stay restorable
+        query = fleet_query(conn, ('user_id', 'content', 'updated_at'))
+        with SnapshotWriter(path) as writer:
+            for chunk in read_chunks(conn, chunk_size, query, 'snapshot_scan'):
+                for user_id, content, updated_at in chunk:
+                    writer.add(user_id, content, _epoch_ms(updated_at))
+        conn.close()
+
+        duration = time.time() - start_time
+        print(f"   ✅ {len(writer.entries):,} users written to {path} ({duration:.2f}s)")
+        print()
+        print("🎯 SNAPSHOT COMPLETE!")
+        return True
+
+    except Exception as e:
+        print(f"❌ ERROR: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def restore_user(path, user_id, apply=False):
+    """
+    Print one user's snapshot content, or write it back with apply=True
+    """
+    try:
+        start_time = time.perf_counter()
+        with SnapshotReader(path) as reader:
+            entry = reader.get(user_id)
+        duration = time.perf_counter() - start_time
+
+        if entry is None:
+            print(f"❌ User {user_id} not found in {path}")
+            return False
+
+        saved = datetime.fromtimestamp(entry.updated_at / 1000, tz=timezone.utc)
+        print(f"📦 User {user_id} (saved {saved.isoformat()}, lookup {duration * 1000:.2f}ms)")
+
+        if not apply:
+            print()
+            print(entry.content)
+            return True
+
+        from db_operations import get_database_connection
+
+        conn = get_database_connection()
+        cur = conn.cursor()
+        # Bump updated_at so clients treat the restored list as the newest version
+        cur.execute("""
+            INSERT INTO todoapp_tasks (user_id, content, updated_at)
+            VALUES (%s, %s, NOW())
+            ON CONFLICT (user_id) DO UPDATE
+              SET content = EXCLUDED.content, updated_at = EXCLUDED.updated_at;
+        """, (entry.user_id, entry.content))
+        conn.commit()
+        cur.close()
+        conn.close()
+
+        print("   ✅ Restored to todoapp_tasks")
+        return True
+
+    except Exception as e:
+        print(f"❌ ERROR: {e}")
+        return False
+
+
+def diff_user(path, user_id):
+    """
+    Task-level diff between a user's snapshot and their current (hot or archived) row
+    """
+    from db_operations import get_database_connection
+    from markdown_parser import parse_markdown_table
+
+    try:
+        with SnapshotReader(path) as reader:
+            entry = reader.get(user_id)
+        if entry is None:
+            print(f"❌ User {user_id} not found in {path}")
+            return False
+
+        conn = get_database_connection()
+        cur = conn.cursor()
+        cur.execute("SELECT content FROM todoapp_tasks WHERE user_id = %s;", (user_id,))
+        row = cur.fetchone()
+        if row is None:
+            # Archived users (archive_users.py) have no hot row until rehydrated
+            cur.execute("SELECT to_regclass('todoapp_tasks_archive') IS NOT NULL;")
+            if cur.fetchone()[0]:
+                cur.execute("SELECT content FROM todoapp_tasks_archive WHERE user_id = %s;", (user_id,))
+                row = cur.fetchone()
+        cur.close()
+        conn.close()
+
+        before = {task['id']: task for task in parse_markdown_table(entry.content)}
+        after = {task['id']: task for task in parse_markdown_table(row[0] if row else '')}
+
+        print(f"🔍 DIFF for {user_id} (snapshot -> current)")
+        print("=" * 60)
+        for task_id in before.keys() - after.keys():
+            print(f"   - {before[task_id]['category']}: {before[task_id]['task'][:60]}")
+        for task_id in after.keys() - before.keys():
+            print(f"   + {after[task_id]['category']}: {after[task_id]['task'][:60]}")
+        for task_id in before.keys() & after.keys():
+            changed = [field for field in ('priority', 'category', 'subcategory', 'task', 'status', 'color')
+                       if before[task_id][field] != after[task_id][field]]
+            if changed:
+                print(f"   ~ {after[task_id]['task'][:60]} ({', '.join(changed)})")
+        print()
+        return True
+
+    except Exception as e:
+        print(f"❌ ERROR: {e}")
+        return False
+
+
+def verify_snapshot(path):
+    try:
+        start_time = time.time()
+        with SnapshotReader(path) as reader:
+            reader.verify()
+            count = len(reader)
+        duration = time.time() - start_time
+        print(f"✅ {path}: {count:,} users, all checksums OK ({duration:.2f}s)")
+        return True
+    except Exception as e:
+        print(f"❌ VERIFY FAILED: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    import profiling
+    profiling.install()
+
+    if len(sys.argv) < 3:
+        print("Usage:")
+        print("  python3 snapshot_archive.py create  <file>             # Snapshot all users")
+        print("  python3 snapshot_archive.py restore <file> <user_id>   # Print one user's tasks")
+        print("  python3 snapshot_archive.py restore <file> <user_id> --apply  # Write them back")
+        print("  python3 snapshot_archive.py diff    <file> <user_id>   # Compare with current row")
+        print("  python3 snapshot_archive.py verify  <file>             # Check all checksums")
+        print("  Add --profile to any command to write CPU/memory/network profiles to profiles/")
+        print()
+        sys.exit(1)
+
+    command = sys.argv[1].lower()
+    path = sys.argv[2]
+
+    if command == "create":
+        success = create_snapshot(path)
+    elif command == "restore" and len(sys.argv) > 3:
+        success = restore_user(path, sys.argv[3], apply='--apply' in sys.argv[4:])
+    elif command == "diff" and len(sys.argv) > 3:
+        success = diff_user(path, sys.argv[3])
+    elif command == "verify":
+        success = verify_snapshot(path)
+    else:
+        print(f"Unknown command: {command}")
+        success = False
+
+    sys.exit(0 if success else 1)
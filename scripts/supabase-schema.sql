@@ -10,36 +10,41 @@ CREATE TABLE IF NOT EXISTS todoapp_tasks (
   created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
 );
 
+-- Client IANA timezone, sent with every save; used by the server-side color reset
+ALTER TABLE todoapp_tasks ADD COLUMN IF NOT EXISTS timezone TEXT;
+
 -- Create unique constraint on user_id (one task list per user)
 CREATE UNIQUE INDEX IF NOT EXISTS todoapp_tasks_user_id_key ON todoapp_tasks(user_id);
 
 -- Add Row Level Security (RLS)
+-- Policies use (select auth.uid()) so it is evaluated once per statement
+-- (initplan) instead of once per row; see benchmark_rls.py
 ALTER TABLE todoapp_tasks ENABLE ROW LEVEL SECURITY;
 
 -- Policy: Users can only see their own tasks
 CREATE POLICY "Users can view their own tasks"
   ON todoapp_tasks
   FOR SELECT
-  USING (auth.uid()::text = user_id);
+  USING ((select auth.uid())::text = user_id);
 
 -- Policy: Users can insert their own tasks
 CREATE POLICY "Users can insert their own tasks"
   ON todoapp_tasks
   FOR INSERT
-  WITH CHECK (auth.uid()::text = user_id);
+  WITH CHECK ((select auth.uid())::text = user_id);
 
 -- Policy: Users can update their own tasks
 CREATE POLICY "Users can update their own tasks"
   ON todoapp_tasks
   FOR UPDATE
-  USING (auth.uid()::text = user_id)
-  WITH CHECK (auth.uid()::text = user_id);
+  USING ((select auth.uid())::text = user_id)
+  WITH CHECK ((select auth.uid())::text = user_id);
 
 -- Policy: Users can delete their own tasks
 CREATE POLICY "Users can delete their own tasks"
   ON todoapp_tasks
   FOR DELETE
-  USING (auth.uid()::text = user_id);
+  USING ((select auth.uid())::text = user_id);
 
 -- Table 2: Quick Prompts Storage
 CREATE TABLE IF NOT EXISTS todoapp_prompts (
@@ -57,26 +62,64 @@ ALTER TABLE todoapp_prompts ENABLE ROW LEVEL SECURITY;
 CREATE POLICY "Users can view their own prompts"
   ON todoapp_prompts
   FOR SELECT
-  USING (auth.uid()::text = user_id);
+  USING ((select auth.uid())::text = user_id);
 
 -- Policy: Users can insert their own prompts
 CREATE POLICY "Users can insert their own prompts"
   ON todoapp_prompts
   FOR INSERT
-  WITH CHECK (auth.uid()::text = user_id);
+  WITH CHECK ((select auth.uid())::text = user_id);
 
 -- Policy: Users can update their own prompts
 CREATE POLICY "Users can update their own prompts"
   ON todoapp_prompts
   FOR UPDATE
-  USING (auth.uid()::text = user_id)
-  WITH CHECK (auth.uid()::text = user_id);
+  USING ((select auth.uid())::text = user_id)
+  WITH CHECK ((select auth.uid())::text = user_id);
 
 -- Policy: Users can delete their own prompts
 CREATE POLICY "Users can delete their own prompts"
   ON todoapp_prompts
   FOR DELETE
-  USING (auth.uid()::text = user_id);
+  USING ((select auth.uid())::text = user_id);
+
+-- Table 3: Cold archive for users untouched for N days (see db_operations.py archive)
+CREATE TABLE IF NOT EXISTS todoapp_tasks_archive (
+  user_id TEXT PRIMARY KEY,
+  source_id BIGINT NOT NULL,
+  content TEXT COMPRESSION lz4 NOT NULL,
+  updated_at TIMESTAMPTZ NOT NULL,
+  created_at TIMESTAMPTZ NOT NULL,
+  archived_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+) WITH (toast_tuple_target = 128);
+
+-- RLS with no policies: only the service role can read archived rows
+ALTER TABLE todoapp_tasks_archive ENABLE ROW LEVEL SECURITY;
+
+-- Move an archived user back into todoapp_tasks (called by GET /api/tasks)
+CREATE OR REPLACE FUNCTION todoapp_rehydrate_user(p_user_id TEXT)
+RETURNS TABLE (content TEXT, updated_at TIMESTAMPTZ)
+LANGUAGE sql
+AS $$
+  -- Insert first: if a concurrent save already created the hot row, the
+  -- insert is skipped and the archive row is kept instead of being lost
+  WITH restored AS (
+    INSERT INTO todoapp_tasks (id, user_id, content, updated_at, created_at)
+    SELECT source_id, user_id, content, updated_at, created_at
+    FROM todoapp_tasks_archive
+    WHERE user_id = p_user_id
+    ON CONFLICT (user_id) DO NOTHING
+    RETURNING todoapp_tasks.user_id, todoapp_tasks.content, todoapp_tasks.updated_at
+  ), cleared AS (
+    DELETE FROM todoapp_tasks_archive a
+    USING restored r
+    WHERE a.user_id = r.user_id
+  )
+  SELECT restored.content, restored.updated_at FROM restored;
+$$;
+
+REVOKE ALL ON FUNCTION todoapp_rehydrate_user(TEXT) FROM PUBLIC;
+GRANT EXECUTE ON FUNCTION todoapp_rehydrate_user(TEXT) TO service_role;
 
 -- Add indexes for better performance
 CREATE INDEX IF NOT EXISTS todoapp_tasks_user_id_idx ON todoapp_tasks(user_id);
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+
+"""
+Fleet-wide task analytics report
+Loads every user's tasks into a ColumnarTaskStore and aggregates with NumPy
+"""
+
+import argparse
+import csv
+import json
+import time
+from datetime import datetime, timezone
+
+try:
+    import numpy as np
+except ImportError:
+    print("📦 Installing numpy...")
+    import subprocess
+    subprocess.check_call(['pip3', 'install', '--quiet', 'numpy'])
+    import numpy as np
+
+from markdown_parser import TASK_COLORS
+from fleet_scan import scan_store
+
+DAY_MS = 24 * 60 * 60 * 1000
+
+# Histogram bucket edges in days: [0, 1), [1, 7), ... [365, inf)
+AGE_BUCKETS = [0, 1, 7, 30, 90, 180, 365, np.inf]
+PERCENTILES = [50, 75, 90, 95, 99]
+
+
+def column(store, name):
+    """
+    Zero-copy NumPy view of a store column
+    """
+    values = getattr(store, name)
+    dtypes = {'I': np.uint32, 'B': np.uint8, 'i': np.int32, 'q': np.int64}
+    return np.frombuffer(values, dtype=dtypes[values.typecode])
+
+
+def value_counts(store, name, top=None):
+    """
+    Counts per decoded value, largest first
+    """
+    codes = column(store, name)
+    labels = TASK_COLORS if name == 'color' else store.dictionaries[name].values
+    counts = np.bincount(codes, minlength=len(labels))
+    order = np.argsort(counts, kind='stable')[::-1]
+    if top is not None:
+        order = order[:top]
+    return {labels[code]: int(counts[code]) for code in order if counts[code]}
+
+
+def distribution(values):
+    """
+    Histogram over AGE_BUCKETS plus percentiles, for an array of days
+    """
+    if values.size == 0:
+        return {'histogram': {}, 'percentiles': {}, 'mean': None}
+
+    counts, _ = np.histogram(values, bins=AGE_BUCKETS)
+    labels = [f"{int(lo)}-{int(hi)}d" if np.isfinite(hi) else f"{int(lo)}d+"
+              for lo, hi in zip(AGE_BUCKETS[:-1], AGE_BUCKETS[1:])]
+    points = np.percentile(values, PERCENTILES)
+    return {
+        'histogram': {label: int(count) for label, count in zip(labels, counts)},
+        'percentiles': {f"p{p}": round(float(v), 2) for p, v in zip(PERCENTILES, points)},
+        'mean': round(float(values.mean()), 2),
+    }
+
+
+def compute_report(store, now_ms=None, top=50):
+    """
+    All aggregates for the analytics report, computed without per-task Python loops
+    """
+    if now_ms is None:
+        now_ms = int(time.time() * 1000)
+
+    task_count = len(store)
+    user_count = len(store.dictionaries['user_id'])
+
+    ages = np.clip(now_ms - column(store, 'created_at'), 0, None) / DAY_MS
+    staleness = np.clip(now_ms - column(store, 'updated_at'), 0, None) / DAY_MS
+
+    list_lengths = np.bincount(column(store, 'user_id'), minlength=user_count)
+    if list_lengths.size:
+        points = np.percentile(list_lengths, PERCENTILES)
+        list_length = {
+            'percentiles': {f"p{p}": round(float(v), 2) for p, v in zip(PERCENTILES, points)},
+            'mean': round(float(list_lengths.mean()), 2),
+            'max': int(list_lengths.max()),
+            'empty_lists': int(np.count_nonzero(list_lengths == 0)),
+        }
+    else:
+        list_length = {'percentiles': {}, 'mean': None, 'max': 0, 'empty_lists': 0}
+
+    red_code = TASK_COLORS.index('red')
+    red_share = float(np.count_nonzero(column(store, 'color') == red_code) / task_count) if task_count else 0.0
+
+    return {
+        'generated_at': datetime.fromtimestamp(now_ms / 1000, tz=timezone.utc).isoformat(),
+        'users': user_count,
+        'tasks': task_count,
+        'red_share': round(red_share, 4),
+        'by_category': value_counts(store, 'category', top),
+        'by_status': value_counts(store, 'status', top),
+        'by_color': value_counts(store, 'color'),
+        'task_age_days': distribution(ages),
+        'staleness_days': distribution(staleness),
+        'list_length': list_length,
+    }
+
+
+def flatten(report, prefix=''):
+    """
+    Yield (metric, value) pairs for the CSV report
+    """
+    for key, value in report.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            yield from flatten(value, f"{name}.")
+        else:
+            yield name, value
+
+
+def write_json(report, path):
+    with open(path, 'w') as f:
+        json.dump(report, f, indent=2)
+
+
+def write_csv(report, path):
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['metric', 'value'])
+        writer.writerows(flatten(report))
+
+
+def run_analytics(argv):
+    """
+    analytics subcommand: scan, aggregate, write JSON (and optionally CSV)
+    """
+    parser = argparse.ArgumentParser(prog='db_operations.py analytics')
+    parser.add_argument('--output', default='analytics_report.json', help='JSON report path')
+    parser.add_argument('--csv', help='Also write a flat metric,value CSV report')
+    parser.add_argument('--top', type=int, default=50, help='Max categories/statuses to list')
+    parser.add_argument('--workers', type=int, help='Parser processes (default: CPU count)')
+    parser.add_argument('--chunk-size', type=int, default=500, help='Rows per cursor fetch / worker chunk')
+    parser.add_argument('--no-cache', action='store_true', help='Recompute even if todoapp_tasks is unchanged')
+    args = parser.parse_args(argv)
+
+    from db_operations import get_database_connection
+
+    try:
+        print("📈 TASK ANALYTICS")
+        print("=" * 60)
+        print()
+
+        conn = get_database_connection()
+
+        def compute():
+            print("1️⃣ Loading tasks...")
+            start_time = time.time()
+            store = scan_store(conn, args.workers, args.chunk_size)
+            duration = time.time() - start_time
+            print(f"   ✅ Loaded {len(store):,} tasks for {len(store.dictionaries['user_id']):,} users ({duration:.2f}s)")
+            print()
+
+            print("2️⃣ Computing aggregates...")
+            start_time = time.time()
+            report = compute_report(store, top=args.top)
+            duration = time.time() - start_time
+            print(f"   ✅ Done ({duration:.2f}s)")
+            return report
+
+        if args.no_cache:
+            report = compute()
+        else:
+            from report_cache import ReportCache, freshness_fingerprint
+            cur = conn.cursor()
+            fingerprint = freshness_fingerprint(cur)
+            cur.close()
+            conn.commit()
+            report, hit = ReportCache().get_or_compute(f"analytics:top={args.top}", fingerprint, compute)
+            if hit:
+                print(f"1️⃣ todoapp_tasks unchanged - reusing report generated at {report['generated_at']}")
+        conn.close()
+        print(f"   🔴 Red (today) share: {report['red_share']:.1%}")
+        print(f"   📏 Median list length: {report['list_length']['percentiles'].get('p50')}")
+        print()
+
+        print("3️⃣ Writing report...")
+        write_json(report, args.output)
+        print(f"   ✅ JSON: {args.output}")
+        if args.csv:
+            write_csv(report, args.csv)
+            print(f"   ✅ CSV: {args.csv}")
+        print()
+
+        print("🎯 ANALYTICS COMPLETE!")
+        return True
+
+    except Exception as e:
+        print(f"❌ ERROR: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
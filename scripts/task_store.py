@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+
+"""
+Compact in-memory task store for fleet-wide analysis
+Columnar layout: dictionary-encoded strings + int64 epoch-ms timestamps
+"""
+
+import sys
+from array import array
+from collections import Counter
+from itertools import compress
+
+from markdown_parser import TASK_COLORS, TASK_FIELDS, parse_markdown_rows, to_iso
+
+# Columns stored as dictionary codes into a StringDictionary
+CODED_COLUMNS = ('user_id', 'category', 'subcategory', 'status')
+
+# array('i') bounds for the priority column
+PRIORITY_MIN, PRIORITY_MAX = -2 ** 31, 2 ** 31 - 1
+
+_COLOR_CODES = {color: code for code, color in enumerate(TASK_COLORS)}
+
+
+class StringDictionary:
+    """
+    Interns strings and hands out dense integer codes
+    """
+
+    __slots__ = ('codes', 'values')
+
+    def __init__(self):
+        self.codes = {}
+        self.values = []
+
+    def encode(self, value):
+        code = self.codes.get(value)
+        if code is None:
+            code = len(self.values)
+            value = sys.intern(value)
+            self.codes[value] = code
+            self.values.append(value)
+        return code
+
+    def lookup(self, value):
+        """
+        Code for value, or None if it was never seen
+        """
+        return self.codes.get(value)
+
+    def __len__(self):
+        return len(self.values)
+
+
+class TaskRecord:
+    """
+    One task, materialized from the store (no per-instance __dict__)
+    """
+
+    __slots__ = ('user_id',) + tuple(TASK_FIELDS)
+
+    def __init__(self, user_id, id, priority, category, subcategory, task,
+                 status, color, created_at, updated_at):
+        self.user_id = user_id
+        self.id = id
+        self.priority = priority
+        self.category = category
+        self.subcategory = subcategory
+        self.task = task
+        self.status = status
+        self.color = color
+        self.created_at = created_at
+        self.updated_at = updated_at
+
+    def to_dict(self):
+        """
+        Task interface shape (ISO timestamps)
+        """
+        task = {field: getattr(self, field) for field in TASK_FIELDS}
+        task['created_at'] = to_iso(self.created_at)
+        task['updated_at'] = to_iso(self.updated_at)
+        return task
+
+    def __repr__(self):
+        return f"TaskRecord(user_id={self.user_id!r}, id={self.id!r}, category={self.category!r})"
+
+
+class ColumnarTaskStore:
+    """
+    Tasks for many users stored column-wise
+
+    Columns:
+      user_id, category, subcategory, status -> array('I') codes
+      color -> array('B') index into TASK_COLORS
+      priority -> array('i'), clamped to the int32 range (P cells are free text)
+      created_at, updated_at -> array('q') epoch milliseconds
+      id, task -> plain lists, only kept when keep_text=True
+    """
+
+    def __init__(self, keep_text=False):
+        self.keep_text = keep_text
+        self.dictionaries = {name: StringDictionary() for name in CODED_COLUMNS}
+        self.user_id = array('I')
+        self.category = array('I')
+        self.subcategory = array('I')
+        self.status = array('I')
+        self.color = array('B')
+        self.priority = array('i')
+        self.created_at = array('q')
+        self.updated_at = array('q')
+        self.id = [] if keep_text else None
+        self.task = [] if keep_text else None
+
+    def __len__(self):
+        return len(self.priority)
+
+    def append_rows(self, user_id, rows):
+        """
+        Append rows from markdown_parser.parse_markdown_rows() for one user
+        """
+        user_code = self.dictionaries['user_id'].encode(user_id)
+        encode_category = self.dictionaries['category'].encode
+        encode_subcategory = self.dictionaries['subcategory'].encode
+        encode_status = self.dictionaries['status'].encode
+
+        for task_id, priority, category, subcategory, task, status, color, created_at, updated_at in rows:
+            self.user_id.append(user_code)
+            self.priority.append(min(max(priority, PRIORITY_MIN), PRIORITY_MAX))
+            self.category.append(encode_category(category))
+            self.subcategory.append(encode_subcategory(subcategory))
+            self.status.append(encode_status(status))
+            self.color.append(_COLOR_CODES[color])
+            self.created_at.append(created_at)
+            self.updated_at.append(updated_at)
+            if self.keep_text:
+                self.id.append(task_id)
+                self.task.append(task)
+
+    def append_content(self, user_id, content, now_ms=None):
+        """
+        Parse one todoapp_tasks.content blob and append its tasks
+        """
+        self.append_rows(user_id, parse_markdown_rows(content, now_ms))
+
+    def extend(self, other):
+        """
+        Append all rows of another store, re-mapping its dictionary codes
+        """
+        for name in CODED_COLUMNS:
+            encode = self.dictionaries[name].encode
+            remap = [encode(value) for value in other.dictionaries[name].values]
+            getattr(self, name).extend(array('I', map(remap.__getitem__, getattr(other, name))))
+
+        for name in ('color', 'priority', 'created_at', 'updated_at'):
+            getattr(self, name).extend(getattr(other, name))
+
+        if self.keep_text:
+            self.id.extend(other.id if other.keep_text else [None] * len(other))
+            self.task.extend(other.task if other.keep_text else [None] * len(other))
+
+    def code_for(self, column, value):
+        """
+        Encode a filter value for a column (None if no row can match)
+        """
+        if column == 'color':
+            return _COLOR_CODES.get(value)
+        if column in self.dictionaries:
+            return self.dictionaries[column].lookup(value)
+        return value
+
+    def decode(self, column, code):
+        if column == 'color':
+            return TASK_COLORS[code]
+        if column in self.dictionaries:
+            return self.dictionaries[column].values[code]
+        return code
+
+    def _condition(self, key, value):
+        """
+        (column values, predicate) for one filter keyword, or None if nothing can match
+        """
+        if key.endswith('_before') or key.endswith('_after'):
+            column, _, bound = key.rpartition('_')
+            test = value.__gt__ if bound == 'before' else value.__lt__
+            return getattr(self, column), test
+
+        code = self.code_for(key, value)
+        if code is None:
+            return None
+        return getattr(self, key), code.__eq__
+
+    def _mask(self, values, test):
+        """
+        One byte per row, 1 where test(value) holds
+        """
+        if values.typecode == 'B':
+            # Byte columns: a translate table evaluates the predicate in C
+            return values.tobytes().translate(bytes(map(test, range(256))))
+        return bytes(map(test, values))
+
+    def filter(self, selection=None, **conditions):
+        """
+        Row indices matching all equality conditions, e.g.
+        store.filter(color='red', status='to_do')
+
+        Timestamp bounds can be given as <column>_before / <column>_after
+        (epoch ms, exclusive). Pass a previous result as selection to narrow it.
+        """
+        resolved = []
+        for key, value in conditions.items():
+            condition = self._condition(key, value)
+            if condition is None:
+                return array('I')
+            resolved.append(condition)
+
+        if selection is not None:
+            indices = selection
+            for values, test in resolved:
+                indices = list(compress(indices, map(test, map(values.__getitem__, indices))))
+            return array('I', indices)
+
+        count = len(self)
+        if not resolved:
+            return array('I', range(count))
+
+        # AND the per-column masks as big integers, then expand to indices once
+        combined = -1
+        for values, test in resolved:
+            combined &= int.from_bytes(self._mask(values, test), 'little')
+        mask = combined.to_bytes(count, 'little') if count else b''
+        return array('I', compress(range(count), mask))
+
+    def group_by(self, column, selection=None):
+        """
+        Row counts per decoded value of column, largest first
+        """
+        values = getattr(self, column)
+        if selection is not None:
+            values = map(values.__getitem__, selection)
+        counts = Counter(values)
+        return {self.decode(column, code): count for code, count in counts.most_common()}
+
+    def record(self, index):
+        return TaskRecord(
+            self.decode('user_id', self.user_id[index]),
+            self.id[index] if self.keep_text else None,
+            self.priority[index],
+            self.decode('category', self.category[index]),
+            self.decode('subcategory', self.subcategory[index]),
+            self.task[index] if self.keep_text else None,
+            self.decode('status', self.status[index]),
+            TASK_COLORS[self.color[index]],
+            self.created_at[index],
+            self.updated_at[index],
+        )
+
+    def take(self, selection):
+        return [self.record(index) for index in selection]
+
+    def nbytes(self):
+        """
+        Approximate footprint of the columns and dictionaries
+        """
+        total = 0
+        for name in ('user_id', 'category', 'subcategory', 'status', 'color',
+                     'priority', 'created_at', 'updated_at'):
+            column = getattr(self, name)
+            total += column.itemsize * len(column)
+        for dictionary in self.dictionaries.values():
+            total += sys.getsizeof(dictionary.codes) + sys.getsizeof(dictionary.values)
+            total += sum(sys.getsizeof(value) for value in dictionary.values)
+        if self.keep_text:
+            total += sys.getsizeof(self.id) + sys.getsizeof(self.task)
+            total += sum(sys.getsizeof(value) for value in self.id)
+            total += sum(sys.getsizeof(value) for value in self.task)
+        return total
@@ -180,6 +180,9 @@ def test_queries(conn):
         return False
 
 if __name__ == "__main__":
+    import profiling
+    profiling.install()
+
     success = test_database_connection()
     if not success:
         exit(1)
@@ -121,5 +121,8 @@ def test_supabase_api():
         return False
 
 if __name__ == "__main__":
+    import profiling
+    profiling.install()
+
     test_supabase_api()
 
@@ -115,6 +115,9 @@ def test_with_supabase_client():
         return False
 
 if __name__ == "__main__":
+    import profiling
+    profiling.install()
+
     if not HAS_SUPABASE:
         print("Installing supabase-py library...")
         print()